@@ -64,7 +64,7 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
 
         self.logger.info(
             f"{agent_name} starting",
-            input_data=str(input_data)[:200]  # Truncate long inputs
+            input_data=self._summarize_input(input_data)
         )
 
         try:
@@ -86,6 +86,21 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
             )
             raise
 
+    @staticmethod
+    def _summarize_input(input_data: Any, max_chars: int = 200) -> str:
+        """
+        Short description of an agent input for the start log line
+
+        Lists (e.g. the posts handed to the downloader) are summarized by
+        length and first item, so the repr of every model in the list is
+        not built just to be truncated to max_chars.
+        """
+        if isinstance(input_data, (list, tuple)):
+            if not input_data:
+                return "[]"
+            return f"[{len(input_data)} items] {input_data[0]}"[:max_chars]
+        return str(input_data)[:max_chars]
+
     def _commit_changes(self) -> None:
         """
         Commit database changes
@@ -4,6 +4,7 @@ from database.models import Company
 from database.repositories import CompanyRepository
 from scrapers.company_scraper import CompanyScraper
 from services.scoring import calculate_importance_score
+from utils.text_processing import normalize_company_name
 from schemas.requests import CompanyDiscoveryInput
 from config.logging_config import get_logger
 
@@ -54,11 +55,24 @@ class CompanyDiscoveryAgent(BaseAgent[CompanyDiscoveryInput, Company]):
             count=len(raw_companies)
         )
 
-        # Step 2: Process and score each company
+        # Step 2: Score every candidate in memory, then persist only the
+        # best-scoring distinct companies (no DB work for discarded rows)
+        scored = sorted(
+            ((calculate_importance_score(raw), raw) for raw in raw_companies),
+            key=lambda item: item[0],
+            reverse=True
+        )
+
         companies = []
-        for raw_company in raw_companies:
-            # Calculate importance score
-            importance_score = calculate_importance_score(raw_company)
+        seen_names = set()
+        for importance_score, raw_company in scored:
+            if len(companies) >= input_data.limit:
+                break
+
+            normalized_name = normalize_company_name(raw_company["name"])
+            if normalized_name in seen_names:
+                continue
+            seen_names.add(normalized_name)
 
             # Prepare company data
             company_data = {
@@ -78,14 +92,13 @@ class CompanyDiscoveryAgent(BaseAgent[CompanyDiscoveryInput, Company]):
         # Commit all changes
         self.db.commit()
 
-        # Step 3: Sort by importance score and return top N
+        # Step 3: Sort by stored importance score (upsert keeps the higher one)
         companies.sort(key=lambda c: c.importance_score or 0, reverse=True)
-        top_companies = companies[:input_data.limit]
 
         self.logger.info(
             "Company discovery completed",
-            total_processed=len(companies),
-            returned=len(top_companies)
+            total_processed=len(scored),
+            returned=len(companies)
         )
 
-        return top_companies
+        return companies
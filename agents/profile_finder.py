@@ -1,4 +1,5 @@
-from typing import List
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
 from agents.base import BaseAgent
 from database.models import Company, SocialProfile
 from database.repositories import SocialProfileRepository
@@ -31,6 +32,23 @@ class ProfileFinderAgent(BaseAgent[Company, SocialProfile]):
             "instagram": self.instagram_scraper
         }
 
+        # (company_id, platform) -> existing profile (or None), filled by
+        # prefetch_existing() so process() can skip its per-company lookup
+        self._existing_profiles: Dict[Tuple[UUID, str], Optional[SocialProfile]] = {}
+
+    def prefetch_existing(self, companies: List[Company]) -> None:
+        """
+        Load already-stored profiles for a batch of companies up front
+
+        Args:
+            companies: Companies about to be passed to execute()
+        """
+        company_ids = [company.id for company in companies]
+        for platform in self.scrapers:
+            found = self.profile_repo.find_by_companies_and_platform(company_ids, platform)
+            for company_id in company_ids:
+                self._existing_profiles[(company_id, platform)] = found.get(company_id)
+
     def process(self, input_data: Company) -> List[SocialProfile]:
         """
         Find social profiles for a company
@@ -52,11 +70,15 @@ class ProfileFinderAgent(BaseAgent[Company, SocialProfile]):
         # Search each platform
         for platform, scraper in self.scrapers.items():
             try:
-                # Check if profile already exists
-                existing = self.profile_repo.find_by_company_and_platform(
-                    company_id=input_data.id,
-                    platform=platform
-                )
+                # Check if profile already exists (prefetched entries are single-use)
+                key = (input_data.id, platform)
+                if key in self._existing_profiles:
+                    existing = self._existing_profiles.pop(key)
+                else:
+                    existing = self.profile_repo.find_by_company_and_platform(
+                        company_id=input_data.id,
+                        platform=platform
+                    )
 
                 if existing:
                     self.logger.info(
@@ -80,27 +102,12 @@ class ProfileFinderAgent(BaseAgent[Company, SocialProfile]):
                     )
                     continue
 
-                # Check if this profile URL already exists (might be for different company)
-                existing_by_url = self.profile_repo.find_by_profile_url(
-                    profile_url=profile_data["profile_url"]
-                )
-
-                if existing_by_url:
-                    self.logger.info(
-                        f"{platform} profile URL already exists",
-                        company_name=input_data.name,
-                        profile_url=profile_data["profile_url"],
-                        existing_company_id=str(existing_by_url.company_id)
-                    )
-                    # Use existing profile instead of creating duplicate
-                    profiles.append(existing_by_url)
-                    continue
-
                 # Calculate engagement score
                 engagement_score = calculate_engagement_score(profile_data)
 
-                # Create profile
-                profile = self.profile_repo.create({
+                # Create profile; a URL already stored (might be for a
+                # different company) is resolved by the unique constraint
+                profile, created = self.profile_repo.get_or_create_by_url({
                     "company_id": input_data.id,
                     "platform": platform,
                     "profile_url": profile_data["profile_url"],
@@ -115,6 +122,16 @@ class ProfileFinderAgent(BaseAgent[Company, SocialProfile]):
 
                 profiles.append(profile)
 
+                if not created:
+                    # Use existing profile instead of creating duplicate
+                    self.logger.info(
+                        f"{platform} profile URL already exists",
+                        company_name=input_data.name,
+                        profile_url=profile_data["profile_url"],
+                        existing_company_id=str(profile.company_id)
+                    )
+                    continue
+
                 self.logger.info(
                     f"Found {platform} profile",
                     company_name=input_data.name,
@@ -1,4 +1,6 @@
-from typing import List
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
 from agents.base import BaseAgent
 from database.models import SocialPost, VideoDownloadJob
 from database.repositories import VideoDownloadJobRepository
@@ -9,6 +11,56 @@ from config.settings import settings
 from config.logging_config import get_logger
 from datetime import datetime
 
+# Failures reported by VideoDownloadService itself that a retry cannot fix
+_PERMANENT_SERVICE_ERRORS = (
+    "download completed but file not found",
+    "yt-dlp not found",
+)
+# yt-dlp "ERROR:" phrases for content that will not appear on retry
+_PERMANENT_YTDLP_ERRORS = (
+    "video unavailable",
+    "this content isn't available",
+    "http error 404",
+    "http error 410",
+    "login required",
+    "unsupported url",
+)
+# Server-side and rate-limit errors stay retryable whatever else matches;
+# Instagram's rate-limit error also says "login required"
+_TRANSIENT_ERROR = re.compile(r"http error (?:429|5\d\d)|rate-limit")
+
+
+def _is_permanent_download_error(error_msg: str) -> bool:
+    """
+    Decide whether a failed download is worth retrying
+
+    Only yt-dlp's ERROR: lines are inspected; the rest of stderr holds
+    warnings whose wording ("unavailable", "private") says nothing about
+    the outcome.
+
+    Args:
+        error_msg: Error text returned by VideoDownloadService
+
+    Returns:
+        True if the failure is permanent and should not be retried
+    """
+    error_msg = error_msg.lower()
+    if any(marker in error_msg for marker in _PERMANENT_SERVICE_ERRORS):
+        return True
+
+    error_lines = [
+        line for line in error_msg.splitlines()
+        if line.startswith("error:")
+    ]
+    if any(_TRANSIENT_ERROR.search(line) for line in error_lines):
+        return False
+
+    return any(
+        marker in line
+        for line in error_lines
+        for marker in _PERMANENT_YTDLP_ERRORS
+    )
+
 
 class VideoDownloaderAgent(BaseAgent[List[SocialPost], List[VideoDownloadJob]]):
     """
@@ -45,36 +97,57 @@ class VideoDownloaderAgent(BaseAgent[List[SocialPost], List[VideoDownloadJob]]):
         )
 
         jobs = []
+        to_download = []  # posts that need a new download job
+
+        # Posts that already have a finished download, resolved in one query
+        done_jobs = self.job_repo.find_done_by_posts([post.id for post in input_data])
 
         for post in input_data:
-            try:
-                # Check if download job already exists
-                existing_job = self.job_repo.find_by_post(post.id)
+            # Check if download job already exists
+            existing_job = done_jobs.get(post.id)
 
-                if existing_job and existing_job.status == "done":
-                    self.logger.info(
-                        "Video already downloaded",
-                        post_url=post.post_url,
-                        file_path=existing_job.file_path
-                    )
-                    jobs.append(existing_job)
-                    continue
-
-                # Create new download job
-                job = self.job_repo.create({
-                    "social_post_id": post.id,
-                    "platform": post.platform,
-                    "post_url": post.post_url,
-                    "status": "pending"
-                })
-
-                # Download video with retry
-                download_result = self._download_with_retry(
+            if existing_job:
+                self.logger.info(
+                    "Video already downloaded",
                     post_url=post.post_url,
-                    platform=post.platform,
-                    post_id=post.external_post_id
+                    file_path=existing_job.file_path
                 )
+                jobs.append(existing_job)
+                continue
+
+            to_download.append(post)
 
+        # Create the new download jobs in one batched INSERT
+        new_jobs = self.job_repo.create_many([
+            {
+                "social_post_id": post.id,
+                "platform": post.platform,
+                "post_url": post.post_url,
+                "status": "pending"
+            }
+            for post in to_download
+        ])
+        # ((post_url, platform, post_id), job) still to download
+        pending = [
+            ((post.post_url, post.platform, post.external_post_id), job)
+            for post, job in zip(to_download, new_jobs)
+        ]
+
+        # Download concurrently; workers only run yt-dlp, all session work
+        # (job status updates) stays on this thread
+        results = self._download_concurrently([args for args, _ in pending])
+
+        for ((post_url, _, _), job), download_result in zip(pending, results):
+            if isinstance(download_result, Exception):
+                # Retries exhausted: record the failure rather than leaving
+                # the job pending forever
+                download_result = {
+                    "status": "error",
+                    "file_path": None,
+                    "error": str(download_result)
+                }
+
+            try:
                 # Update job status
                 if download_result["status"] == "success":
                     self.job_repo.update_status(
@@ -84,7 +157,7 @@ class VideoDownloaderAgent(BaseAgent[List[SocialPost], List[VideoDownloadJob]]):
                     )
                     self.logger.info(
                         "Video downloaded successfully",
-                        post_url=post.post_url,
+                        post_url=post_url,
                         file_path=download_result["file_path"]
                     )
                 else:
@@ -95,18 +168,18 @@ class VideoDownloaderAgent(BaseAgent[List[SocialPost], List[VideoDownloadJob]]):
                     )
                     self.logger.error(
                         "Video download failed",
-                        post_url=post.post_url,
+                        post_url=post_url,
                         error=download_result["error"]
                     )
 
-                # Refresh job to get updated data
-                self.db.refresh(job)
+                # update_status() changed this same identity-mapped instance
+                # through the shared session, so no refresh SELECT is needed
                 jobs.append(job)
 
             except Exception as e:
                 self.logger.error(
                     "Error processing download",
-                    post_url=post.post_url if post else None,
+                    post_url=post_url,
                     error=str(e)
                 )
                 # Continue with other downloads
@@ -127,6 +200,34 @@ class VideoDownloaderAgent(BaseAgent[List[SocialPost], List[VideoDownloadJob]]):
 
         return jobs
 
+    def _download_concurrently(self, downloads: List[Tuple[str, str, str]]) -> list:
+        """
+        Run downloads on a bounded thread pool
+
+        Args:
+            downloads: (post_url, platform, post_id) per video
+
+        Returns:
+            Download result dict, or the raised exception, per input (in order)
+        """
+        if not downloads:
+            return []
+
+        def _run(args):
+            post_url, platform, post_id = args
+            try:
+                return self._download_with_retry(
+                    post_url=post_url,
+                    platform=platform,
+                    post_id=post_id
+                )
+            except Exception as e:
+                return e
+
+        max_workers = min(settings.VIDEO_DOWNLOAD_CONCURRENCY, len(downloads))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_run, downloads))
+
     @retry(
         max_attempts=3,
         delay=2.0,
@@ -153,9 +254,8 @@ class VideoDownloaderAgent(BaseAgent[List[SocialPost], List[VideoDownloadJob]]):
 
         # If download failed, raise exception to trigger retry
         if result["status"] == "error":
-            # Don't retry certain errors
-            error_msg = result.get("error", "")
-            if "not found" in error_msg.lower() or "yt-dlp not found" in error_msg.lower():
+            # Don't retry errors another attempt cannot fix
+            if _is_permanent_download_error(result.get("error") or ""):
                 return result  # Return error without retry
 
             raise VideoDownloadError(result["error"])
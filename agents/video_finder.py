@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from datetime import datetime, timedelta, timezone
 from agents.base import BaseAgent
 from database.models import SocialProfile, SocialPost
@@ -8,6 +8,9 @@ from services.scoring import classify_content_type
 from config.settings import settings
 from config.logging_config import get_logger
 
+# Post types treated as video content
+_VIDEO_POST_TYPES = frozenset({"reel", "short", "video"})
+
 
 class VideoFinderAgent(BaseAgent[SocialProfile, SocialPost]):
     """
@@ -64,63 +67,108 @@ class VideoFinderAgent(BaseAgent[SocialProfile, SocialPost]):
 
         # Filter and process posts
         posts = []
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=settings.VIDEO_FINDER_DAYS_BACK)
+        # One timestamp per run: used for the cutoff and every last_scraped_at
+        scraped_at = datetime.now(timezone.utc)
+        cutoff_date = scraped_at - timedelta(days=settings.VIDEO_FINDER_DAYS_BACK)
 
+        # Pass 1: apply the date/type/views filters before touching the DB,
+        # so only posts that survive them are looked up
+        candidates = []  # (raw_post, published_at, post_type, view_count)
         for raw_post in raw_posts:
+            # Bind the lookup once; each post is read field-by-field below
+            get = raw_post.get
             try:
                 # Parse published date
-                published_at = self._parse_date(raw_post.get("published_at"))
+                published_at = self._parse_date(get("published_at"), default=scraped_at)
 
                 # Filter by date
                 if published_at and published_at < cutoff_date:
                     continue
 
                 # Filter by post type (videos only)
-                post_type = raw_post.get("post_type", "").lower()
-                if post_type not in ["reel", "short", "video"]:
+                post_type = get("post_type", "").lower()
+                if post_type not in _VIDEO_POST_TYPES:
                     continue
 
                 # Filter by minimum views
-                view_count = raw_post.get("view_count", 0)
+                view_count = get("view_count", 0)
                 if view_count < settings.VIDEO_FINDER_MIN_VIEWS:
                     continue
 
-                # Check if post already exists
-                existing = self.post_repo.find_by_external_id(
-                    profile_id=input_data.id,
-                    external_post_id=raw_post["external_post_id"]
+                candidates.append((raw_post, published_at, post_type, view_count))
+
+            except Exception as e:
+                self.logger.error(
+                    "Error processing post",
+                    post_url=get("post_url"),
+                    error=str(e)
                 )
+                # Continue with other posts
+
+        # Already-stored posts among the candidates, fetched in one query
+        existing_posts = self.post_repo.find_by_external_ids(
+            profile_id=input_data.id,
+            external_post_ids=[
+                raw_post["external_post_id"]
+                for raw_post, _, _, _ in candidates
+                if raw_post.get("external_post_id")
+            ]
+        )
+
+        # New posts, keyed by external ID, inserted together after the loop
+        new_posts = {}
+
+        # Pass 2: reuse stored posts, queue the rest for insertion
+        for raw_post, published_at, post_type, view_count in candidates:
+            get = raw_post.get
+            try:
+                # Check if post already exists
+                external_post_id = raw_post["external_post_id"]
+                existing = existing_posts.get(external_post_id)
 
                 if existing:
                     posts.append(existing)
                     continue
 
-                # Create new post
-                post = self.post_repo.create({
+                if external_post_id in new_posts:
+                    continue
+
+                # Queue new post
+                new_posts[external_post_id] = {
                     "social_profile_id": input_data.id,
                     "platform": input_data.platform,
                     "post_type": post_type,
                     "post_url": raw_post["post_url"],
-                    "external_post_id": raw_post["external_post_id"],
-                    "caption_text": raw_post.get("caption_text"),
+                    "external_post_id": external_post_id,
+                    "caption_text": get("caption_text"),
                     "published_at": published_at,
-                    "like_count": raw_post.get("like_count"),
-                    "comment_count": raw_post.get("comment_count"),
-                    "view_count": raw_post.get("view_count"),
-                    "saved_count": raw_post.get("saved_count"),
-                    "last_scraped_at": datetime.now(timezone.utc)
-                })
-
-                posts.append(post)
+                    "like_count": get("like_count"),
+                    "comment_count": get("comment_count"),
+                    "view_count": view_count,
+                    "saved_count": get("saved_count"),
+                    "last_scraped_at": scraped_at
+                }
 
             except Exception as e:
                 self.logger.error(
                     "Error processing post",
-                    post_url=raw_post.get("post_url"),
+                    post_url=get("post_url"),
                     error=str(e)
                 )
                 # Continue with other posts
 
+        # Create all new posts in one batched INSERT
+        try:
+            posts.extend(self.post_repo.create_many(list(new_posts.values())))
+        except Exception as e:
+            self.db.rollback()
+            self.logger.error(
+                "Error saving new posts",
+                profile_username=input_data.username,
+                post_count=len(new_posts),
+                error=str(e)
+            )
+
         # Commit all changes
         self.db.commit()
 
@@ -148,7 +196,7 @@ class VideoFinderAgent(BaseAgent[SocialProfile, SocialPost]):
             profile = self.db.get(SocialProfile, input_data.id)
             if profile:
                 profile.content_type = content_type
-                profile.last_scraped_at = datetime.now(timezone.utc)
+                profile.last_scraped_at = scraped_at
                 self.db.add(profile)
                 self.db.commit()
 
@@ -160,18 +208,30 @@ class VideoFinderAgent(BaseAgent[SocialProfile, SocialPost]):
 
         return posts
 
-    def _parse_date(self, date_str: str) -> datetime:
-        """Parse ISO format date string to datetime"""
+    def _parse_date(self, date_str: str, default: Optional[datetime] = None) -> datetime:
+        """
+        Parse ISO format date string to datetime
+
+        Args:
+            date_str: ISO 8601 string, optionally ending in 'Z'
+            default: Value for missing/unparseable dates (defaults to now)
+
+        Returns:
+            Parsed timezone-aware datetime
+        """
+        if default is None:
+            default = datetime.now(timezone.utc)
+
         if not date_str:
-            return datetime.now(timezone.utc)
+            return default
 
         try:
             # Handle ISO format with 'Z'
             if date_str.endswith('Z'):
                 date_str = date_str[:-1] + '+00:00'
-            return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            return datetime.fromisoformat(date_str)
         except Exception:
-            return datetime.now(timezone.utc)
+            return default
 
     def _sort_posts_by_performance(self, posts: List[SocialPost]) -> List[SocialPost]:
         """
@@ -16,25 +16,25 @@ with get_db_session() as session:
     print(f"  Posts: {posts_count}")
     print(f"  Download Jobs: {jobs_count}")
 
-    # Show companies
+    # Show companies (samples select only the printed columns; a job's
+    # error_message alone can hold a whole yt-dlp stderr)
     if companies_count > 0:
         print(f"\n=== Companies ===")
-        companies = session.exec(select(Company).limit(5)).all()
-        for c in companies:
-            print(f"  - {c.name} ({c.source})")
+        companies = session.exec(select(Company.name, Company.source).limit(5)).all()
+        print("\n".join(f"  - {c.name} ({c.source})" for c in companies))
 
     # Show profiles
     if profiles_count > 0:
         print(f"\n=== Social Profiles ===")
-        profiles = session.exec(select(SocialProfile).limit(5)).all()
-        for p in profiles:
-            print(f"  - {p.platform}: {p.username} ({p.followers_count} followers)")
+        profiles = session.exec(
+            select(SocialProfile.platform, SocialProfile.username, SocialProfile.followers_count).limit(5)
+        ).all()
+        print("\n".join(f"  - {p.platform}: {p.username} ({p.followers_count} followers)" for p in profiles))
 
     # Show download jobs
     if jobs_count > 0:
         print(f"\n=== Download Jobs ===")
-        jobs = session.exec(select(VideoDownloadJob).limit(5)).all()
-        for j in jobs:
-            print(f"  - {j.status}: {j.post_url[:50]}...")
+        jobs = session.exec(select(VideoDownloadJob.status, VideoDownloadJob.post_url).limit(5)).all()
+        print("\n".join(f"  - {j.status}: {j.post_url[:50]}..." for j in jobs))
 
     print()
@@ -3,13 +3,12 @@ Crawl4AI cache'ini temizle
 Gerçek veriler için cache'i temizleyin
 """
 
-from pathlib import Path
 from config.settings import settings
 
-cache_dir = Path(__file__).parent / "data" / "crawl_cache"
+cache_dir = settings.DATA_DIR / "crawl_cache"
 
 if cache_dir.exists():
-    cache_files = list(cache_dir.glob("*.json"))
+    cache_files = list(cache_dir.glob("*.json*"))
     if cache_files:
         print(f"🗑️  {len(cache_files)} cache dosyası bulundu")
         for cache_file in cache_files:
@@ -1,21 +1,13 @@
 """Clear all records from database"""
 from database.session import get_db_session
 from database.models import SocialProfile, SocialPost, VideoDownloadJob, Company
-from sqlmodel import select
+from sqlalchemy import delete
 
 with get_db_session() as session:
-    # Delete in order (respecting foreign keys)
-    for job in session.exec(select(VideoDownloadJob)).all():
-        session.delete(job)
-
-    for post in session.exec(select(SocialPost)).all():
-        session.delete(post)
-
-    for profile in session.exec(select(SocialProfile)).all():
-        session.delete(profile)
-
-    for company in session.exec(select(Company)).all():
-        session.delete(company)
+    # Delete in order (respecting foreign keys), one bulk DELETE per table
+    # instead of loading every row into the session first
+    for model in (VideoDownloadJob, SocialPost, SocialProfile, Company):
+        session.execute(delete(model))
 
     session.commit()
     print("Database cleared successfully!")
@@ -1,11 +1,22 @@
 import structlog
 import logging
+import orjson
 from typing import Optional
 from config.settings import settings
 
+_configured = False
+
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """Serialize log events with orjson (stdlib handlers expect str)"""
+    return orjson.dumps(obj, default=str).decode("utf-8")
+
 
 def configure_logging() -> None:
     """Configure structlog with context binding"""
+    global _configured
+    if _configured:
+        return
 
     structlog.configure(
         processors=[
@@ -19,7 +30,7 @@ def configure_logging() -> None:
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
             # JSON in production, console in dev
-            structlog.processors.JSONRenderer() if not settings.DEBUG
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps) if not settings.DEBUG
             else structlog.dev.ConsoleRenderer()
         ],
         wrapper_class=structlog.stdlib.BoundLogger,
@@ -34,6 +45,8 @@ def configure_logging() -> None:
         level=getattr(logging, settings.LOG_LEVEL.upper()),
     )
 
+    _configured = True
+
 
 def get_logger(name: Optional[str] = None) -> structlog.stdlib.BoundLogger:
     """Get a configured structlog logger"""
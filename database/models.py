@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index, text
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID, uuid4
@@ -33,6 +34,10 @@ class Company(SQLModel, table=True):
     Real estate and construction companies discovered by the system
     """
     __tablename__ = "companies"
+    __table_args__ = (
+        # Upsert/dedup and active-company lookups filter on both columns
+        Index("ix_companies_city_country", "city", "country"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     name: str = Field(index=True)
@@ -57,6 +62,9 @@ class SocialProfile(SQLModel, table=True):
     Social media profiles (Instagram, TikTok, YouTube) for companies
     """
     __tablename__ = "social_profiles"
+    __table_args__ = (
+        Index("ix_social_profiles_company_platform", "company_id", "platform"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     company_id: UUID = Field(foreign_key="companies.id")
@@ -85,6 +93,10 @@ class SocialPost(SQLModel, table=True):
     Individual posts/videos from social media profiles
     """
     __tablename__ = "social_posts"
+    __table_args__ = (
+        Index("ix_social_posts_profile_external_id", "social_profile_id", "external_post_id"),
+        Index("ix_social_posts_profile_published", "social_profile_id", "published_at"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     social_profile_id: UUID = Field(foreign_key="social_profiles.id")
@@ -115,6 +127,22 @@ class VideoDownloadJob(SQLModel, table=True):
     Video download jobs and their status
     """
     __tablename__ = "video_download_jobs"
+    __table_args__ = (
+        # Latest job per post: WHERE social_post_id = ? ORDER BY created_at DESC
+        Index("ix_video_download_jobs_post_created", "social_post_id", "created_at"),
+        # Partial indexes: only rows in the filtered state are indexed, so
+        # they stay small while finished jobs accumulate
+        Index(
+            "ix_video_download_jobs_done_file",
+            "social_post_id",
+            postgresql_where=text("status = 'done' AND file_path IS NOT NULL"),
+        ),
+        Index(
+            "ix_video_download_jobs_pending",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     social_post_id: UUID = Field(foreign_key="social_posts.id")
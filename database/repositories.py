@@ -1,5 +1,6 @@
 from sqlmodel import Session, select
-from typing import List, Optional, Dict
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import List, Optional, Dict, Tuple
 from uuid import UUID
 from datetime import datetime, timezone, timedelta
 from database.models import Company, SocialProfile, SocialPost, VideoDownloadJob
@@ -27,20 +28,24 @@ class CompanyRepository:
         """
         normalized_name = normalize_company_name(company_data["name"])
 
-        # Check if company exists
-        statement = select(Company).where(
+        # Check if company exists; only id + name are needed to match. A
+        # plain SELECT: a city holds a handful of companies, so a server-side
+        # cursor (yield_per) would only add DECLARE/FETCH/CLOSE round trips
+        statement = select(Company.id, Company.name).where(
             Company.city == company_data["city"],
             Company.country == company_data["country"]
         )
-        existing_companies = self.session.exec(statement).all()
 
-        # Find matching company by normalized name
-        existing = None
-        for comp in existing_companies:
-            if normalize_company_name(comp.name) == normalized_name:
-                existing = comp
+        # Find matching company by normalized name, stopping at the first match
+        existing_id = None
+        for company_id, name in self.session.exec(statement):
+            if normalize_company_name(name) == normalized_name:
+                existing_id = company_id
                 break
 
+        # Load the full entity only for the match (identity map first)
+        existing = self.session.get(Company, existing_id) if existing_id else None
+
         if existing:
             # Update if importance score is higher
             if company_data.get("importance_score", 0) > existing.importance_score:
@@ -62,7 +67,7 @@ class CompanyRepository:
             Company.country == country,
             Company.is_active == True
         )
-        return list(self.session.exec(statement).all())
+        return self.session.exec(statement).all()
 
     def update_importance_score(self, company_id: UUID, score: float) -> None:
         """Update company importance score"""
@@ -98,6 +103,47 @@ class SocialProfileRepository:
         )
         return self.session.exec(statement).first()
 
+    def find_by_companies_and_platform(
+        self, company_ids: List[UUID], platform: str
+    ) -> Dict[UUID, SocialProfile]:
+        """Find active profiles on a platform for many companies in one query, keyed by company ID"""
+        if not company_ids:
+            return {}
+        statement = select(SocialProfile).where(
+            SocialProfile.company_id.in_(set(company_ids)),
+            SocialProfile.platform == platform,
+            SocialProfile.is_active == True
+        )
+        profiles = {}
+        for profile in self.session.exec(statement):
+            # Same pick as find_by_company_and_platform's .first()
+            profiles.setdefault(profile.company_id, profile)
+        return profiles
+
+    def get_or_create_by_url(self, profile_data: dict) -> Tuple[SocialProfile, bool]:
+        """
+        Insert a profile unless its URL is already stored, in one statement
+
+        Relies on the unique profile_url constraint: INSERT ... ON CONFLICT
+        returns the existing row instead of a separate lookup beforehand,
+        and two concurrent inserts of the same URL cannot both succeed.
+
+        Args:
+            profile_data: Column values for a new SocialProfile
+
+        Returns:
+            (profile, created) - created is False when the URL already existed
+        """
+        candidate = SocialProfile(**profile_data)
+        insert_stmt = pg_insert(SocialProfile).values(**candidate.model_dump())
+        statement = insert_stmt.on_conflict_do_update(
+            index_elements=[SocialProfile.profile_url],
+            # No-op update so RETURNING yields the existing row on conflict
+            set_={"profile_url": insert_stmt.excluded.profile_url}
+        ).returning(SocialProfile)
+        profile = self.session.scalars(statement).one()
+        return profile, profile.id == candidate.id
+
     def find_by_profile_url(self, profile_url: str) -> Optional[SocialProfile]:
         """Find a social profile by URL"""
         statement = select(SocialProfile).where(
@@ -121,8 +167,9 @@ class SocialProfileRepository:
                 profile.posts_count = posts_count
             if engagement_score is not None:
                 profile.engagement_score = engagement_score
-            profile.last_scraped_at = datetime.now(timezone.utc)
-            profile.updated_at = datetime.now(timezone.utc)
+            now = datetime.now(timezone.utc)
+            profile.last_scraped_at = now
+            profile.updated_at = now
             self.session.add(profile)
 
 
@@ -140,6 +187,19 @@ class SocialPostRepository:
         self.session.refresh(post)
         return post
 
+    def create_many(self, posts_data: List[dict]) -> List[SocialPost]:
+        """
+        Create several social posts with a single flush
+
+        Every column default is generated client-side, so the instances are
+        complete without a refresh SELECT per row.
+        """
+        posts = [SocialPost(**post_data) for post_data in posts_data]
+        if posts:
+            self.session.add_all(posts)
+            self.session.flush()
+        return posts
+
     def find_by_external_id(
         self, profile_id: UUID, external_post_id: str
     ) -> Optional[SocialPost]:
@@ -150,6 +210,21 @@ class SocialPostRepository:
         )
         return self.session.exec(statement).first()
 
+    def find_by_external_ids(
+        self, profile_id: UUID, external_post_ids: List[str]
+    ) -> Dict[str, SocialPost]:
+        """Find a profile's posts by external IDs in one query, keyed by external ID"""
+        if not external_post_ids:
+            return {}
+        statement = select(SocialPost).where(
+            SocialPost.social_profile_id == profile_id,
+            SocialPost.external_post_id.in_(set(external_post_ids))
+        )
+        return {
+            post.external_post_id: post
+            for post in self.session.exec(statement)
+        }
+
     def find_recent_by_profile(
         self, profile_id: UUID, days: int = 90
     ) -> List[SocialPost]:
@@ -159,26 +234,26 @@ class SocialPostRepository:
             SocialPost.social_profile_id == profile_id,
             SocialPost.published_at >= cutoff_date
         ).order_by(SocialPost.published_at.desc())
-        return list(self.session.exec(statement).all())
+        return self.session.exec(statement).all()
 
     def find_video_posts_without_download(self, limit: int = 100) -> List[SocialPost]:
         """Find video posts that haven't been downloaded yet"""
+        # Anti-join: posts with no download job, filtered in SQL so the
+        # limit applies to matching rows and no job collections are loaded
+        has_job = (
+            select(VideoDownloadJob.id)
+            .where(VideoDownloadJob.social_post_id == SocialPost.id)
+            .exists()
+        )
         statement = (
             select(SocialPost)
             .where(
-                SocialPost.post_type.in_(["reel", "short", "video"])
+                SocialPost.post_type.in_(["reel", "short", "video"]),
+                ~has_job
             )
             .limit(limit)
         )
-        posts = list(self.session.exec(statement).all())
-
-        # Filter out posts that already have download jobs
-        posts_without_jobs = []
-        for post in posts:
-            if not post.download_jobs:
-                posts_without_jobs.append(post)
-
-        return posts_without_jobs
+        return self.session.exec(statement).all()
 
 
 class VideoDownloadJobRepository:
@@ -195,6 +270,14 @@ class VideoDownloadJobRepository:
         self.session.refresh(job)
         return job
 
+    def create_many(self, jobs_data: List[dict]) -> List[VideoDownloadJob]:
+        """Create several download jobs with a single flush (no per-row refresh)"""
+        jobs = [VideoDownloadJob(**job_data) for job_data in jobs_data]
+        if jobs:
+            self.session.add_all(jobs)
+            self.session.flush()
+        return jobs
+
     def update_status(
         self,
         job_id: UUID,
@@ -218,7 +301,30 @@ class VideoDownloadJobRepository:
         statement = select(VideoDownloadJob).where(
             VideoDownloadJob.status == "pending"
         ).limit(limit)
-        return list(self.session.exec(statement).all())
+        return self.session.exec(statement).all()
+
+    def find_done_by_posts(self, post_ids: List[UUID]) -> Dict[UUID, VideoDownloadJob]:
+        """
+        Find completed download jobs for a batch of posts in one query
+
+        Served by the partial (status = 'done' AND file_path IS NOT NULL)
+        index; returns the newest done job per post, keyed by post ID.
+        """
+        if not post_ids:
+            return {}
+        # DISTINCT ON keeps one row per post in Postgres, so re-downloaded
+        # posts don't ship their older jobs back just to be discarded here
+        statement = select(VideoDownloadJob).where(
+            VideoDownloadJob.social_post_id.in_(set(post_ids)),
+            VideoDownloadJob.status == "done",
+            VideoDownloadJob.file_path.isnot(None)
+        ).distinct(
+            VideoDownloadJob.social_post_id
+        ).order_by(
+            VideoDownloadJob.social_post_id,
+            VideoDownloadJob.created_at.desc()
+        )
+        return {job.social_post_id: job for job in self.session.exec(statement)}
 
     def find_by_post(self, post_id: UUID) -> Optional[VideoDownloadJob]:
         """Find download job for a specific post"""
@@ -8,9 +8,17 @@ from config.settings import settings
 engine = create_engine(
     settings.DATABASE_URL,
     echo=settings.DB_ECHO,
-    pool_pre_ping=True,  # Verify connections before using
-    pool_size=5,
-    max_overflow=10
+    # Liveness is handled by pool_recycle plus SQLAlchemy's disconnect
+    # detection (a dead connection invalidates the pool); pre-ping costs a
+    # round trip per checkout, so it is opt-in
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # LRU of compiled statements: repeated repository/API queries skip
+    # SQL compilation; literal values must stay bound parameters to hit it
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE
 )
 
 
@@ -38,6 +46,12 @@ def get_db_session() -> Generator[Session, None, None]:
 def init_db() -> None:
     """
     Initialize database schema
-    Creates all tables defined in SQLModel models
+    Creates all tables defined in SQLModel models, plus any indexes
+    missing from tables that already existed
     """
     SQLModel.metadata.create_all(engine)
+
+    # create_all() skips existing tables, so add newer indexes explicitly
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
@@ -13,14 +13,20 @@ Supports both CLI and REST API modes:
 """
 
 import argparse
-from typing import Dict, Optional, List
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Annotated, Dict, Optional, List
 from datetime import datetime, timezone
-from uuid import UUID
+from uuid import UUID, uuid4
+import orjson
 import uvicorn
 
 # FastAPI imports
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from pydantic import BaseModel, Field, ConfigDict
 
 # Database and agents
@@ -31,9 +37,11 @@ from agents.video_finder import VideoFinderAgent
 from agents.video_downloader import VideoDownloaderAgent
 from schemas.requests import CompanyDiscoveryInput
 from database.models import Company, SocialProfile, SocialPost, VideoDownloadJob
+from services.llm_service import OllamaLLMService
 from config.logging_config import get_logger
 from config.settings import settings
-from sqlmodel import select
+from sqlmodel import select, func
+from sqlalchemy import true
 
 logger = get_logger(__name__)
 
@@ -204,6 +212,7 @@ class AgentOrchestrator:
             "Step 2/4: Finding social profiles",
             company_count=len(companies)
         )
+        self.profile_agent.prefetch_existing(companies)
         all_profiles = []
         for company in companies:
             profiles = self.profile_agent.execute(company)
@@ -238,23 +247,7 @@ class AgentOrchestrator:
             }
 
         # Step 4: Download videos (limit per company)
-        # Group posts by company
-        posts_by_company = {}
-        for post in all_posts:
-            # Get company_id from the profile
-            profile = next((p for p in all_profiles if p.id == post.social_profile_id), None)
-            if profile:
-                company_id = profile.company_id
-                if company_id not in posts_by_company:
-                    posts_by_company[company_id] = []
-                posts_by_company[company_id].append(post)
-
-        # Limit posts per company based on VIDEO_DOWNLOAD_PER_COMPANY setting
-        posts_to_download = []
-        for company_id, posts in posts_by_company.items():
-            # Take only the first N posts per company (already sorted by views/engagement)
-            limited_posts = posts[:settings.VIDEO_DOWNLOAD_PER_COMPANY]
-            posts_to_download.extend(limited_posts)
+        posts_to_download = self.select_posts_for_download(all_profiles, all_posts)
 
         self.logger.info(
             "Step 4/4: Downloading videos",
@@ -279,6 +272,32 @@ class AgentOrchestrator:
 
         return results
 
+    @staticmethod
+    def select_posts_for_download(all_profiles: list, all_posts: list) -> list:
+        """
+        Pick the first VIDEO_DOWNLOAD_PER_COMPANY posts of each company
+
+        Args:
+            all_profiles: Social profiles the posts belong to
+            all_posts: Posts, already sorted by views/engagement per profile
+
+        Returns:
+            Posts to download, grouped by company in first-seen order
+        """
+        company_by_profile = {p.id: p.company_id for p in all_profiles}
+        posts_by_company = {}
+        for post in all_posts:
+            company_id = company_by_profile.get(post.social_profile_id)
+            if company_id is not None:
+                posts_by_company.setdefault(company_id, []).append(post)
+
+        limit = settings.VIDEO_DOWNLOAD_PER_COMPANY
+        return [
+            post
+            for posts in posts_by_company.values()
+            for post in posts[:limit]
+        ]
+
     def run_company_discovery_only(self, city: str, country: str, limit: int = 50):
         """Run only company discovery step"""
         discovery_input = CompanyDiscoveryInput(city=city, country=country, limit=limit)
@@ -328,6 +347,7 @@ def run_discovery_pipeline(job_id: str, city: str, country: str, limit: int):
 
             # Step 2: Find profiles
             job_status[job_id]["progress"] = f"Finding profiles for {len(companies)} companies..."
+            orchestrator.profile_agent.prefetch_existing(companies)
             all_profiles = []
             for company in companies:
                 profiles = orchestrator.profile_agent.execute(company)
@@ -343,23 +363,7 @@ def run_discovery_pipeline(job_id: str, city: str, country: str, limit: int):
             # Step 4: Download videos (limit per company)
             job_status[job_id]["progress"] = f"Preparing to download videos (limit: {settings.VIDEO_DOWNLOAD_PER_COMPANY} per company)..."
 
-            # Group posts by company
-            posts_by_company = {}
-            for post in all_posts:
-                # Get company_id from the profile
-                profile = next((p for p in all_profiles if p.id == post.social_profile_id), None)
-                if profile:
-                    company_id = profile.company_id
-                    if company_id not in posts_by_company:
-                        posts_by_company[company_id] = []
-                    posts_by_company[company_id].append(post)
-
-            # Limit posts per company based on VIDEO_DOWNLOAD_PER_COMPANY setting
-            posts_to_download = []
-            for company_id, posts in posts_by_company.items():
-                # Take only the first N posts per company (already sorted by views/engagement)
-                limited_posts = posts[:settings.VIDEO_DOWNLOAD_PER_COMPANY]
-                posts_to_download.extend(limited_posts)
+            posts_to_download = orchestrator.select_posts_for_download(all_profiles, all_posts)
 
             job_status[job_id]["progress"] = f"Downloading {len(posts_to_download)} videos..."
             download_jobs = orchestrator.downloader_agent.execute(posts_to_download)
@@ -375,7 +379,7 @@ def run_discovery_pipeline(job_id: str, city: str, country: str, limit: int):
             }
 
     except Exception as e:
-        logger.error(f"Discovery pipeline failed", job_id=job_id, error=str(e))
+        logger.error("Discovery pipeline failed", job_id=job_id, error=str(e))
         job_status[job_id] = {
             "status": "failed",
             "error": str(e),
@@ -387,11 +391,43 @@ def run_discovery_pipeline(job_id: str, city: str, country: str, limit: int):
 # FASTAPI APPLICATION
 # ============================================================================
 
+# Discovery pipelines are long, blocking jobs. Running them on their own
+# bounded pool keeps them off the threadpool that serves the sync endpoints.
+# Threads rather than processes: job_status is shared in-process state.
+_PIPELINE_POOL = ThreadPoolExecutor(
+    max_workers=settings.PIPELINE_WORKERS,
+    thread_name_prefix="discovery-pipeline"
+)
+# The executor's own queue is unbounded; cap running + waiting jobs so a
+# burst of requests gets a 503 instead of piling up work nobody will wait for
+_PIPELINE_SLOTS = threading.BoundedSemaphore(
+    settings.PIPELINE_WORKERS + settings.PIPELINE_MAX_QUEUED
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the local LLM so the first discovery job skips the model load"""
+    warmup_task = None
+    if settings.LLM_PROVIDER == "ollama":
+        # Runs in the background so the server starts accepting requests immediately
+        warmup_task = asyncio.create_task(
+            asyncio.to_thread(OllamaLLMService(timeout=settings.OLLAMA_TIMEOUT).warmup)
+        )
+    yield
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+    _PIPELINE_POOL.shutdown(wait=False, cancel_futures=True)
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Real Estate Marketing Intelligence API",
     description="Instagram video discovery and download for real estate companies",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # orjson rendering for every route instead of stdlib json
+    default_response_class=ORJSONResponse
 )
 
 
@@ -413,10 +449,7 @@ async def root():
 
 
 @app.post("/api/discover", response_model=DiscoverResponse)
-async def discover_companies(
-    request: DiscoverRequest,
-    background_tasks: BackgroundTasks
-):
+async def discover_companies(request: DiscoverRequest):
     """
     Start company discovery and video processing pipeline
 
@@ -429,17 +462,26 @@ async def discover_companies(
 
     The process runs in the background. Use GET /api/job/{job_id} to check progress.
     """
-    import uuid
-    job_id = str(uuid.uuid4())
+    if not _PIPELINE_SLOTS.acquire(blocking=False):
+        raise HTTPException(
+            status_code=503,
+            detail="Too many discovery jobs queued, try again later",
+            headers={"Retry-After": "60"}
+        )
+
+    job_id = uuid4().hex
 
-    # Start background task
-    background_tasks.add_task(
+    job_status[job_id] = {"status": "queued"}
+
+    # Start pipeline on the dedicated pool; the slot frees when it finishes
+    future = _PIPELINE_POOL.submit(
         run_discovery_pipeline,
         job_id,
         request.city,
         request.country,
         request.companies
     )
+    future.add_done_callback(lambda _: _PIPELINE_SLOTS.release())
 
     logger.info(
         "Discovery job started",
@@ -470,10 +512,10 @@ async def get_job_status(job_id: str):
 
 
 @app.get("/api/companies", response_model=List[CompanyResponse])
-async def list_companies(
+def list_companies(
     city: Optional[str] = None,
     country: Optional[str] = None,
-    limit: int = 50
+    limit: Annotated[int, Query(ge=1, le=500)] = 50
 ):
     """
     List discovered companies
@@ -481,7 +523,16 @@ async def list_companies(
     Filter by city and/or country, or get all companies.
     """
     with get_db_session() as session:
-        statement = select(Company)
+        # Fetch only the response columns instead of full ORM rows
+        statement = select(
+            Company.id,
+            Company.name,
+            Company.website_url,
+            Company.city,
+            Company.country,
+            Company.importance_score,
+            Company.created_at
+        )
 
         if city:
             statement = statement.where(Company.city == city)
@@ -490,26 +541,30 @@ async def list_companies(
 
         statement = statement.order_by(Company.importance_score.desc()).limit(limit)
 
-        companies = session.exec(statement).all()
-
-        return [
-            CompanyResponse(
-                id=str(c.id),
-                name=c.name,
-                website_url=c.website_url,
-                city=c.city,
-                country=c.country,
-                importance_score=c.importance_score or 0.0,
-                created_at=c.created_at
-            )
-            for c in companies
-        ]
+        rows = session.exec(statement).all()
+
+        # Rows are already in response shape: render them directly, skipping
+        # FastAPI's response_model validation and jsonable_encoder pass.
+        # UUIDs and datetimes are left as-is; orjson encodes them natively
+        # to the same strings a str()/isoformat() per field would produce
+        return ORJSONResponse([
+            {
+                "id": row.id,
+                "name": row.name,
+                "website_url": row.website_url,
+                "city": row.city,
+                "country": row.country,
+                "importance_score": row.importance_score or 0.0,
+                "created_at": row.created_at
+            }
+            for row in rows
+        ])
 
 
 @app.get("/api/profiles", response_model=List[ProfileResponse])
-async def list_profiles(
+def list_profiles(
     platform: Optional[str] = "instagram",
-    limit: int = 50
+    limit: Annotated[int, Query(ge=1, le=500)] = 50
 ):
     """
     List social media profiles
@@ -517,107 +572,202 @@ async def list_profiles(
     Filter by platform (instagram, tiktok, youtube)
     """
     with get_db_session() as session:
-        statement = select(SocialProfile).where(
+        # Fetch only the response columns, with the company name joined in,
+        # instead of full rows plus one lazy company load per profile
+        statement = select(
+            SocialProfile.id,
+            SocialProfile.company_id,
+            Company.name.label("company_name"),
+            SocialProfile.platform,
+            SocialProfile.username,
+            SocialProfile.profile_url,
+            SocialProfile.followers_count,
+            SocialProfile.engagement_score,
+            SocialProfile.content_type
+        ).outerjoin(
+            Company, Company.id == SocialProfile.company_id
+        ).where(
             SocialProfile.platform == platform
         ).order_by(
             SocialProfile.engagement_score.desc()
         ).limit(limit)
 
-        profiles = session.exec(statement).all()
+        rows = session.exec(statement).all()
+
+        # Rendered directly, as in list_companies
+        return ORJSONResponse([
+            {
+                "id": row.id,
+                "company_id": row.company_id,
+                "company_name": row.company_name or "Unknown",
+                "platform": row.platform,
+                "username": row.username,
+                "profile_url": row.profile_url,
+                "followers_count": row.followers_count,
+                "engagement_score": row.engagement_score,
+                "content_type": row.content_type
+            }
+            for row in rows
+        ])
 
-        return [
-            ProfileResponse(
-                id=str(p.id),
-                company_id=str(p.company_id),
-                company_name=p.company.name if p.company else "Unknown",
-                platform=p.platform,
-                username=p.username,
-                profile_url=p.profile_url,
-                followers_count=p.followers_count,
-                engagement_score=p.engagement_score,
-                content_type=p.content_type
-            )
-            for p in profiles
-        ]
+
+# View-count floor for /api/videos listings when no ids are requested
+_DEFAULT_MIN_VIEWS = 1000
 
 
 @app.get("/api/videos", response_model=List[VideoResponse])
-async def list_videos(
+def list_videos(
     sort_by: str = "views",
-    min_views: int = 1000,
-    limit: int = 100
+    min_views: Annotated[Optional[int], Query(ge=0)] = None,
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+    ids: Annotated[Optional[List[UUID]], Query()] = None
 ):
     """
     List video posts
 
     Sort by: views, likes, engagement
-    Filter by minimum views
+    Filter by minimum views (default 1000), or fetch specific posts with
+    repeated ?ids=... (no view filter unless min_views is given; at most
+    `limit` ids)
     """
-    with get_db_session() as session:
-        statement = select(SocialPost).where(
-            SocialPost.view_count >= min_views
+    post_ids = set(ids) if ids else None
+    if post_ids and len(post_ids) > limit:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Too many ids: {len(post_ids)} requested, limit is {limit}"
         )
+    if min_views is None and not post_ids:
+        min_views = _DEFAULT_MIN_VIEWS
+
+    # Latest download job per returned post: a correlated LATERAL subquery,
+    # so Postgres probes (social_post_id, created_at) once per post (a
+    # backward index scan, LIMIT 1) instead of ranking the whole jobs table
+    latest_job = (
+        select(VideoDownloadJob.status, VideoDownloadJob.file_path)
+        .where(VideoDownloadJob.social_post_id == SocialPost.id)
+        .order_by(VideoDownloadJob.created_at.desc())
+        .limit(1)
+        .correlate(SocialPost)
+        .lateral()
+    )
 
-        if sort_by == "views":
-            statement = statement.order_by(SocialPost.view_count.desc())
-        elif sort_by == "likes":
-            statement = statement.order_by(SocialPost.like_count.desc())
-        else:
-            statement = statement.order_by(SocialPost.view_count.desc())
-
-        statement = statement.limit(limit)
-
-        posts = session.exec(statement).all()
-
-        # Get download status for each post
-        results = []
-        for post in posts:
-            download_job = session.exec(
-                select(VideoDownloadJob).where(
-                    VideoDownloadJob.social_post_id == post.id
-                ).order_by(VideoDownloadJob.created_at.desc())
-            ).first()
-
-            results.append(VideoResponse(
-                id=str(post.id),
-                profile_id=str(post.social_profile_id),
-                username=post.social_profile.username if post.social_profile else "Unknown",
-                post_url=post.post_url,
-                view_count=post.view_count,
-                like_count=post.like_count,
-                comment_count=post.comment_count,
-                published_at=post.published_at,
-                download_status=download_job.status if download_job else None,
-                file_path=download_job.file_path if download_job else None
-            ))
+    # Only the response columns: no caption text or other post/profile
+    # fields are loaded, and username comes from the join in the same row
+    statement = select(
+        SocialPost.id,
+        SocialPost.social_profile_id,
+        SocialProfile.username,
+        SocialPost.post_url,
+        SocialPost.view_count,
+        SocialPost.like_count,
+        SocialPost.comment_count,
+        SocialPost.published_at,
+        latest_job.c.status.label("download_status"),
+        latest_job.c.file_path
+    ).outerjoin(
+        SocialProfile, SocialProfile.id == SocialPost.social_profile_id
+    ).outerjoin(
+        latest_job, true()
+    )
 
-        return results
+    if min_views is not None:
+        statement = statement.where(SocialPost.view_count >= min_views)
+
+    if post_ids:
+        statement = statement.where(SocialPost.id.in_(post_ids))
+
+    if sort_by == "views":
+        statement = statement.order_by(SocialPost.view_count.desc())
+    elif sort_by == "likes":
+        statement = statement.order_by(SocialPost.like_count.desc())
+    else:
+        statement = statement.order_by(SocialPost.view_count.desc())
+
+    statement = statement.limit(limit)
+
+    # Read everything (limit <= 500) and release the connection before the
+    # body is written, so a slow client never holds a pooled connection
+    with get_db_session() as session:
+        rows = session.exec(statement).all()
+
+    # Rendered directly, as in list_companies
+    return ORJSONResponse([
+        {
+            "id": row.id,
+            "profile_id": row.social_profile_id,
+            "username": row.username or "Unknown",
+            "post_url": row.post_url,
+            "view_count": row.view_count,
+            "like_count": row.like_count,
+            "comment_count": row.comment_count,
+            "published_at": row.published_at,
+            "download_status": row.download_status,
+            "file_path": row.file_path
+        }
+        for row in rows
+    ])
+
+
+# Last /api/status result: (fetched_at, encoded JSON body). Dashboards poll
+# this endpoint; callers within the TTL share one set of COUNT queries (and
+# one encoding), and the lock makes concurrent callers wait for the
+# in-flight query instead of issuing their own.
+_STATUS_CACHE: Optional[tuple] = None
+_STATUS_TTL_SECONDS = 5.0
+_STATUS_LOCK = threading.Lock()
 
 
 @app.get("/api/status", response_model=StatusResponse)
-async def get_status():
+def get_status():
     """
     Get overall system status
 
     Returns counts of companies, profiles, videos, and downloads
     """
+    global _STATUS_CACHE
+    with _STATUS_LOCK:
+        cached = _STATUS_CACHE
+        now = time.monotonic()
+        if not cached or now - cached[0] >= _STATUS_TTL_SECONDS:
+            # Plain ints from COUNT(*): nothing for a StatusResponse
+            # round-trip to validate, so encode the dict directly
+            cached = (time.monotonic(), orjson.dumps(_query_status()))
+            _STATUS_CACHE = cached
+
+    return Response(content=cached[1], media_type="application/json")
+
+
+def _query_status() -> Dict[str, object]:
+    """Count companies, profiles, videos, and downloads in one query"""
     with get_db_session() as session:
-        total_companies = session.exec(select(Company)).all()
-        total_profiles = session.exec(select(SocialProfile)).all()
-        total_videos = session.exec(select(SocialPost)).all()
-
-        download_jobs = session.exec(select(VideoDownloadJob)).all()
-        downloaded = sum(1 for j in download_jobs if j.status == "done")
-        pending = sum(1 for j in download_jobs if j.status == "pending")
-
-        return StatusResponse(
-            status="online",
-            total_companies=len(total_companies),
-            total_profiles=len(total_profiles),
-            total_videos=len(total_videos),
-            downloaded_videos=downloaded,
-            pending_downloads=pending
-        )
+        def count_of(model, *criteria):
+            return select(func.count()).select_from(model).where(*criteria).scalar_subquery()
+
+        # All counters as scalar subqueries of one statement (one round trip)
+        (
+            total_companies,
+            total_profiles,
+            total_videos,
+            downloaded,
+            pending
+        ) = session.exec(
+            select(
+                count_of(Company),
+                count_of(SocialProfile),
+                count_of(SocialPost),
+                count_of(VideoDownloadJob, VideoDownloadJob.status == "done"),
+                count_of(VideoDownloadJob, VideoDownloadJob.status == "pending")
+            )
+        ).one()
+
+        return {
+            "status": "online",
+            "total_companies": total_companies,
+            "total_profiles": total_profiles,
+            "total_videos": total_videos,
+            "downloaded_videos": downloaded,
+            "pending_downloads": pending
+        }
 
 
 # ============================================================================
@@ -659,15 +809,18 @@ def run_cli(args):
                     limit=args.limit
                 )
 
-                # Print results
-                print("\n" + "="*60)
-                print("PIPELINE RESULTS")
-                print("="*60)
-                print(f"Companies Discovered:  {results['companies']}")
-                print(f"Social Profiles Found: {results['profiles']}")
-                print(f"Video Posts Found:     {results['posts']}")
-                print(f"Videos Downloaded:     {results['downloads']}")
-                print("="*60 + "\n")
+                # Print results (render once, single write to stdout)
+                rule = "=" * 60
+                print(
+                    f"\n{rule}\n"
+                    "PIPELINE RESULTS\n"
+                    f"{rule}\n"
+                    f"Companies Discovered:  {results['companies']}\n"
+                    f"Social Profiles Found: {results['profiles']}\n"
+                    f"Video Posts Found:     {results['posts']}\n"
+                    f"Videos Downloaded:     {results['downloads']}\n"
+                    f"{rule}\n"
+                )
 
             elif args.step == "discovery":
                 companies = orchestrator.run_company_discovery_only(
@@ -675,9 +828,13 @@ def run_cli(args):
                     country=args.country,
                     limit=args.limit
                 )
-                print(f"\nDiscovered {len(companies)} companies")
-                for company in companies[:10]:  # Show first 10
-                    print(f"  - {company.name} ({company.importance_score:.2f})")
+                # Header plus first 10 companies, joined into one write
+                lines = [f"\nDiscovered {len(companies)} companies"]
+                lines.extend(
+                    f"  - {company.name} ({company.importance_score:.2f})"
+                    for company in companies[:10]
+                )
+                print("\n".join(lines))
 
             else:
                 print(f"Step '{args.step}' not fully implemented in CLI")
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
@@ -63,4 +63,4 @@ class PipelineStatsResponse(BaseModel):
     profiles_found: int
     posts_found: int
     videos_downloaded: int
-    errors: List[str] = []
+    errors: List[str] = Field(default_factory=list)
@@ -1,4 +1,6 @@
 from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import requests
 from bs4 import BeautifulSoup
 from utils.retry import retry
@@ -12,6 +14,14 @@ logger = structlog.get_logger(__name__)
 class CompanyScraper:
     """Scraper for discovering real estate companies"""
 
+    # Crawl handler and LLM parser shared by all scraper instances in the process
+    _shared_pipeline = None
+    _pipeline_lock = threading.Lock()
+    # Crawls the next directory URL while the LLM parses the current page
+    # (CRAWL4AI_PREFETCH). One worker: crawls stay sequential, so the
+    # handler's rate limit holds
+    _crawl_prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="crawl-prefetch")
+
     def __init__(self):
         self.timeout = settings.REQUEST_TIMEOUT
         self.user_agent = settings.USER_AGENT
@@ -49,6 +59,26 @@ class CompanyScraper:
 
         return companies[:limit]
 
+    @classmethod
+    def _get_crawl_pipeline(cls):
+        """
+        Get the shared (Crawl4AIHandler, LLMParser) pair, built once per process
+
+        Building them creates the cache directory, the LLM client and runs
+        the Ollama availability check, so it is not repeated per search.
+        """
+        pipeline = cls._shared_pipeline
+        if pipeline is not None:
+            return pipeline
+
+        with cls._pipeline_lock:
+            if cls._shared_pipeline is None:
+                from scrapers.crawl4ai_handler import Crawl4AIHandler
+                from scrapers.parsers.llm_parser import LLMParser
+
+                cls._shared_pipeline = (Crawl4AIHandler(), LLMParser())
+            return cls._shared_pipeline
+
     def _scrape_with_crawl4ai(self, query: str) -> List[Dict]:
         """
         Implementation using crawl4ai + LLM parsing
@@ -64,15 +94,12 @@ class CompanyScraper:
         Returns:
             List of company dictionaries
         """
-        logger.info(f"Starting Crawl4AI + LLM scraping for query: {query}")
+        logger.info("Starting Crawl4AI + LLM scraping", query=query)
 
         try:
-            from scrapers.crawl4ai_handler import Crawl4AIHandler
-            from scrapers.parsers.llm_parser import LLMParser
             from scrapers.parsers.realtor_parser import RealtorParser
 
-            handler = Crawl4AIHandler()
-            llm_parser = LLMParser()
+            handler, llm_parser = self._get_crawl_pipeline()
             companies = []
 
             # Strategy 1: Try direct real estate company websites
@@ -187,30 +214,40 @@ class CompanyScraper:
                     "https://www.coldwellbanker.com",  # Coldwell Banker - Global
                 ])
             
-            # Try each directory URL with LLM
-            for url in directory_urls:
+            # Try each directory URL with LLM. With CRAWL4AI_PREFETCH, URL i+1
+            # is crawled in the background while URL i is parsed; off by
+            # default because the first URL usually succeeds, which makes
+            # the prefetched crawl wasted browser time and rate-limit delay
+            prefetch = settings.CRAWL4AI_PREFETCH
+            next_crawl = None
+            for i, url in enumerate(directory_urls):
                 try:
-                    logger.info(f"Strategy 1: Direct site + LLM: {url}")
-                    html = handler.crawl_sync(url)
+                    logger.info("Strategy 1: Direct site + LLM", url=url)
+                    html = next_crawl.result() if next_crawl else handler.crawl_sync(url)
+                    next_crawl = None
+                    if prefetch and i + 1 < len(directory_urls):
+                        next_crawl = self._crawl_prefetcher.submit(
+                            handler.crawl_sync, directory_urls[i + 1]
+                        )
 
                     if html and len(html) > 5000:  # Ensure we got real content
-                        logger.info(f"HTML retrieved: {len(html):,} characters from {url}")
+                        logger.info("HTML retrieved", url=url, characters=len(html))
                         companies = llm_parser.extract_companies(
                             html=html,
                             query_context=query,
                             limit=50
                         )
-                        logger.info(f"LLM parser returned {len(companies)} companies from {url}")
+                        logger.info("LLM parser returned companies", url=url, count=len(companies))
 
                         if companies:
                             return companies  # Success!
                         else:
-                            logger.warning(f"LLM found no companies from {url}, trying next URL")
+                            logger.warning("LLM found no companies, trying next URL", url=url)
                     else:
-                        logger.warning(f"HTML too short or empty from {url}: {len(html) if html else 0} characters")
+                        logger.warning("HTML too short or empty", url=url, characters=len(html) if html else 0)
 
                 except Exception as e:
-                    logger.warning(f"Direct site {url} failed: {e}")
+                    logger.warning("Direct site failed", url=url, error=str(e))
                     continue
 
             # No companies found from any URL - return empty list (no mock data)
@@ -218,5 +255,5 @@ class CompanyScraper:
             return []
 
         except Exception as e:
-            logger.error(f"Crawl4AI scraping error: {e}", exc_info=True)
+            logger.error("Crawl4AI scraping error", error=str(e), exc_info=True)
             return []
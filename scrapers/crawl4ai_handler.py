@@ -1,9 +1,12 @@
 import asyncio
+import hashlib
 import time
 import random
+import threading
+import zlib
 from typing import Optional
 from pathlib import Path
-import json
+import orjson
 import structlog
 from config.settings import settings
 
@@ -19,8 +22,11 @@ class Crawl4AIHandler:
         self.user_agents = settings.CRAWL4AI_USER_AGENTS.split(",")
         self.cache_enabled = settings.CRAWL4AI_CACHE_ENABLED
         self.cache_expiry_hours = settings.CRAWL4AI_CACHE_EXPIRY_HOURS
-        self.cache_dir = Path(__file__).parent.parent / "data" / "crawl_cache"
+        self.cache_dir = settings.DATA_DIR / "crawl_cache"
         self.last_request_time = 0
+        # One asyncio.Runner (event loop) per calling thread, reused across
+        # crawls; the handler is shared between pipeline threads
+        self._local = threading.local()
 
         # Create cache directory
         if self.cache_enabled:
@@ -33,7 +39,7 @@ class Crawl4AIHandler:
 
         if elapsed < delay_seconds:
             sleep_time = delay_seconds - elapsed
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
+            logger.debug("Rate limiting", sleep_seconds=round(sleep_time, 2))
             time.sleep(sleep_time)
 
         self.last_request_time = time.time()
@@ -41,9 +47,8 @@ class Crawl4AIHandler:
     def _get_cache_path(self, url: str) -> Path:
         """Get cache file path for a URL"""
         # Simple hash of URL for filename
-        import hashlib
         url_hash = hashlib.md5(url.encode()).hexdigest()
-        return self.cache_dir / f"{url_hash}.json"
+        return self.cache_dir / f"{url_hash}.json.z"
 
     def _get_cached_result(self, url: str) -> Optional[str]:
         """Get cached HTML if available and not expired"""
@@ -51,25 +56,30 @@ class Crawl4AIHandler:
             return None
 
         cache_path = self._get_cache_path(url)
-        if not cache_path.exists():
-            return None
+        expiry_seconds = self.cache_expiry_hours * 3600
 
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            # Cheap expiry pre-check from file metadata, so stale entries
+            # are skipped without reading and decoding the whole HTML
+            if time.time() - cache_path.stat().st_mtime > expiry_seconds:
+                logger.debug("Cache expired", url=url)
+                return None
+
+            cache_data = orjson.loads(zlib.decompress(cache_path.read_bytes()))
 
             # Check expiry
             cached_time = cache_data.get("timestamp", 0)
-            expiry_seconds = self.cache_expiry_hours * 3600
             if time.time() - cached_time > expiry_seconds:
-                logger.debug(f"Cache expired for {url}")
+                logger.debug("Cache expired", url=url)
                 return None
 
-            logger.info(f"Cache hit for {url}")
+            logger.info("Cache hit", url=url)
             return cache_data.get("html")
 
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            logger.warning(f"Failed to read cache: {e}")
+            logger.warning("Failed to read cache", error=str(e))
             return None
 
     def _save_to_cache(self, url: str, html: str):
@@ -85,13 +95,13 @@ class Crawl4AIHandler:
                 "html": html
             }
 
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False)
+            # HTML is highly repetitive; fast zlib level shrinks entries several-fold
+            cache_path.write_bytes(zlib.compress(orjson.dumps(cache_data), 1))
 
-            logger.debug(f"Saved to cache: {url}")
+            logger.debug("Saved to cache", url=url)
 
         except Exception as e:
-            logger.warning(f"Failed to save to cache: {e}")
+            logger.warning("Failed to save to cache", error=str(e))
 
     def _get_random_user_agent(self) -> str:
         """Get a random user agent from the list"""
@@ -109,7 +119,7 @@ class Crawl4AIHandler:
         if cached_html:
             return cached_html
 
-        logger.info(f"Crawling URL: {url}")
+        logger.info("Crawling URL", url=url)
 
         try:
             async with AsyncWebCrawler(
@@ -123,7 +133,7 @@ class Crawl4AIHandler:
                 )
 
                 if not result.success:
-                    logger.error(f"Crawl failed for {url}: {result.error_message}")
+                    logger.error("Crawl failed", url=url, error=result.error_message)
                     return ""
 
                 html = result.html
@@ -134,9 +144,17 @@ class Crawl4AIHandler:
                 return html
 
         except Exception as e:
-            logger.error(f"Crawl error for {url}: {e}", exc_info=True)
+            logger.error("Crawl error", url=url, error=str(e), exc_info=True)
             return ""
 
+    def _get_runner(self) -> asyncio.Runner:
+        """Get this thread's event loop runner, creating it on first use"""
+        runner = getattr(self._local, "runner", None)
+        if runner is None:
+            runner = asyncio.Runner()
+            self._local.runner = runner
+        return runner
+
     def crawl_sync(self, url: str) -> str:
         """
         Synchronous wrapper for async crawl
@@ -148,7 +166,9 @@ class Crawl4AIHandler:
             HTML content as string
         """
         try:
-            return asyncio.run(self._crawl_async(url))
+            # Reuse the thread's loop instead of asyncio.run() building and
+            # tearing down a new one for every URL
+            return self._get_runner().run(self._crawl_async(url))
         except Exception as e:
-            logger.error(f"Sync crawl error: {e}", exc_info=True)
+            logger.error("Sync crawl error", error=str(e), exc_info=True)
             return ""
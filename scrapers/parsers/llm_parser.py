@@ -12,6 +12,9 @@ from services.llm_service import HTMLCompanyExtractor
 
 logger = structlog.get_logger(__name__)
 
+# Optional company fields copied through when the LLM returns a value
+_OPTIONAL_FIELDS = ("phone", "address", "description", "rating", "reviews_count")
+
 
 class LLMParser:
     """Parser that uses LLM to extract company data from HTML"""
@@ -67,7 +70,7 @@ class LLMParser:
                     validated_companies.append(self._normalize_company(company))
             
             logger.info(
-                f"LLM extraction completed",
+                "LLM extraction completed",
                 extracted=len(companies),
                 validated=len(validated_companies)
             )
@@ -75,7 +78,7 @@ class LLMParser:
             return validated_companies
             
         except Exception as e:
-            logger.error(f"LLM parsing failed: {e}", exc_info=True)
+            logger.error("LLM parsing failed", error=str(e), exc_info=True)
             return []
     
     def _is_valid_company(self, company: Dict) -> bool:
@@ -143,17 +146,10 @@ class LLMParser:
                 url = "https://" + url
             normalized["website_url"] = url
         
-        # Add optional fields if present
-        optional_fields = [
-            "phone",
-            "address", 
-            "description",
-            "rating",
-            "reviews_count"
-        ]
-        
-        for field in optional_fields:
-            if field in company and company[field]:
-                normalized[field] = company[field]
+        # Add optional fields if present (one lookup per field)
+        for field in _OPTIONAL_FIELDS:
+            value = company.get(field)
+            if value:
+                normalized[field] = value
         
         return normalized
@@ -1,5 +1,13 @@
-from pathlib import Path
+from dataclasses import dataclass
+from itertools import islice
 from typing import Optional, Dict, List
+import random
+import re
+import threading
+import time
+import urllib.parse
+import requests
+from requests.adapters import HTTPAdapter
 from scrapers.social.base import BaseSocialScraper
 from config.settings import settings
 from datetime import datetime
@@ -7,10 +15,57 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Shared session for DuckDuckGo searches: keep-alive connections are reused
+# across companies instead of a new TCP + TLS handshake per search. One
+# host, so a single pool sized for the concurrent discovery pipelines
+_DDG_SESSION = requests.Session()
+_DDG_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=1, pool_maxsize=max(settings.PIPELINE_WORKERS, 1))
+)
+_DDG_SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+})
+
+# Turkish → ASCII mapping (Instagram usernames have no Turkish characters)
+_TURKISH_TO_ASCII = str.maketrans({
+    'ı': 'i', 'İ': 'I', 'ş': 's', 'Ş': 'S',
+    'ğ': 'g', 'Ğ': 'G', 'ü': 'u', 'Ü': 'U',
+    'ö': 'o', 'Ö': 'O', 'ç': 'c', 'Ç': 'C'
+})
+# Characters dropped when turning a company name into a username base,
+# removed in one translate() pass instead of a chain of replace() copies
+_USERNAME_STRIP = str.maketrans("", "", " &.,-_'\"")
+_USERNAME_PART_STRIP = str.maketrans("", "", " -.")
+
+# Instagram system paths that look like usernames in search result links
+_RESERVED_INSTAGRAM_PATHS = frozenset({
+    'www', 'accounts', 'explore', 'direct', 'about', 'blog', 'developers', 'popular', 'help',
+    'legal', 'stories', 'reels', 'tv', 'p', 'reel', 'tags', 'locations'
+})
+# Ad/redirect hosts and non-profile Instagram paths skipped during link extraction
+_AD_LINK_MARKERS = ('googleadservices.com', 'doubleclick.net', 'google.com/search', 'google.com/url')
+_NON_PROFILE_PATH_MARKERS = ('/p/', '/reel/', '/tv/', '/stories/', '/explore/', '/accounts/')
+
+
+@dataclass(slots=True)
+class _BasicProfile:
+    """Stand-in for instaloader.Profile when only the username is known (login required)"""
+    username: str
+    followers: int = 0  # Bilinmiyor
+    mediacount: int = 0
+    biography: str = ""
+
 
 class InstagramScraper(BaseSocialScraper):
     """Instagram scraper with real instaloader support"""
 
+    # Authenticated loader shared by all scraper instances in the process
+    _shared_loader = None
+    _loader_lock = threading.Lock()
+
     def __init__(self):
         super().__init__()
         self.session_file = settings.INSTAGRAM_SESSION_FILE
@@ -18,8 +73,41 @@ class InstagramScraper(BaseSocialScraper):
     def _get_platform_name(self) -> str:
         return "instagram"
 
-    def _get_authenticated_loader(self, force_relogin: bool = False):
-        """Get Instaloader instance with authentication"""
+    def _get_authenticated_loader(self, force_relogin: bool = False, stale_loader=None):
+        """
+        Get the shared Instaloader instance, logging in once per process
+
+        Concurrent callers wait on the same lock, so only one of them
+        loads the session file (or logs in); the rest reuse its loader.
+        Only logged-in loaders are shared: the anonymous fallback is
+        rebuilt on each call, so a session created later (or a finished
+        checkpoint) is picked up without a restart.
+
+        Args:
+            force_relogin: Discard the session and log in again
+            stale_loader: Loader that got the 401; if another thread has
+                already replaced it, that fresh loader is returned instead
+                of logging in a second time
+        """
+        loader = InstagramScraper._shared_loader
+        if loader is not None and not force_relogin:
+            return loader
+
+        with InstagramScraper._loader_lock:
+            current = InstagramScraper._shared_loader
+            if current is not None:
+                if not force_relogin:
+                    return current
+                if stale_loader is not None and current is not stale_loader:
+                    # Another thread re-logged in while we waited
+                    return current
+
+            loader = self._build_authenticated_loader(force_relogin)
+            InstagramScraper._shared_loader = loader if loader.context.is_logged_in else None
+            return loader
+
+    def _build_authenticated_loader(self, force_relogin: bool = False):
+        """Build a new Instaloader instance with authentication"""
         import instaloader
 
         L = instaloader.Instaloader()
@@ -68,7 +156,6 @@ class InstagramScraper(BaseSocialScraper):
                     )
                     # Extract checkpoint URL if available
                     if "https://" in error_msg:
-                        import re
                         url_match = re.search(r'https://[^\s]+', error_msg)
                         if url_match:
                             checkpoint_url = url_match.group(0)
@@ -95,22 +182,8 @@ class InstagramScraper(BaseSocialScraper):
         Returns:
             List of Instagram profile URLs found via DuckDuckGo
         """
-        import time
-        import random
-        import re
-        
         # Clean company name - remove Turkish characters
-        def clean_turkish_chars(text: str) -> str:
-            replacements = {
-                'ı': 'i', 'İ': 'I', 'ş': 's', 'Ş': 'S',
-                'ğ': 'g', 'Ğ': 'G', 'ü': 'u', 'Ü': 'U',
-                'ö': 'o', 'Ö': 'O', 'ç': 'c', 'Ç': 'C'
-            }
-            for tr, en in replacements.items():
-                text = text.replace(tr, en)
-            return text
-        
-        company_clean = clean_turkish_chars(company_name)
+        company_clean = company_name.translate(_TURKISH_TO_ASCII)
         
         # DuckDuckGo search URL - no cookie consent!
         search_query = f'{company_clean} instagram'
@@ -120,15 +193,7 @@ class InstagramScraper(BaseSocialScraper):
         
         try:
             # requests ile DuckDuckGo'yu aç (crawl4ai engelleniyordu)
-            import requests
-            
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-            }
-            
-            response = requests.get(ddg_url, headers=headers, timeout=15)
+            response = _DDG_SESSION.get(ddg_url, timeout=15)
             response.raise_for_status()
             response_text = response.text
             
@@ -136,17 +201,18 @@ class InstagramScraper(BaseSocialScraper):
                 logger.warning("Empty HTML from DuckDuckGo")
                 return []
             
-            logger.info(f"DuckDuckGo HTML received: {len(response_text)} chars")
+            logger.info("DuckDuckGo HTML received", characters=len(response_text))
             
-            # DEBUG: HTML'i dosyaya kaydet (ilk 50000 karakter)
-            try:
-                debug_file = Path(__file__).parent.parent / "data" / "google_debug.html"
-                debug_file.parent.mkdir(parents=True, exist_ok=True)
-                with open(debug_file, 'w', encoding='utf-8') as f:
-                    f.write(response_text[:50000])
-                logger.info(f"DuckDuckGo HTML saved to {debug_file}")
-            except Exception as e:
-                logger.debug(f"Could not save debug HTML: {e}")
+            # DEBUG: HTML'i dosyaya kaydet (ilk 50000 byte) - sadece DEBUG modunda
+            # Ham yanıt byte'larından memoryview ile yaz: str slice kopyası ve yeniden encode yok
+            if settings.DEBUG:
+                try:
+                    debug_file = settings.DATA_DIR / "google_debug.html"
+                    debug_file.parent.mkdir(parents=True, exist_ok=True)
+                    debug_file.write_bytes(memoryview(response.content)[:50000])
+                    logger.info("DuckDuckGo HTML saved", path=str(debug_file))
+                except Exception as e:
+                    logger.debug("Could not save debug HTML", error=str(e))
             
             # Parse HTML - Basit yaklaşım: Regex ile direkt Instagram linklerini bul
             from bs4 import BeautifulSoup
@@ -162,7 +228,6 @@ class InstagramScraper(BaseSocialScraper):
             # - https%3A%2F%2Finstagram.com%2Fusername (URL encoded)
             
             # Önce URL decode yap
-            import urllib.parse
             decoded_html = urllib.parse.unquote(response_text)
             
             # Daha esnek pattern - sadece instagram.com/ sonrasındaki username'i al
@@ -170,20 +235,20 @@ class InstagramScraper(BaseSocialScraper):
             matches = re.findall(instagram_pattern, decoded_html, re.IGNORECASE)
             
             # DEBUG: Kaç match bulundu
-            logger.info(f"Regex found {len(matches)} potential usernames in DuckDuckGo HTML")
+            logger.info("Regex found potential usernames in DuckDuckGo HTML", count=len(matches))
             
             for username in matches:
                 # Sistem sayfalarını skip et
-                invalid = ['www', 'accounts', 'explore', 'direct', 'about', 'blog', 'developers', 'popular', 'help', 'legal', 'stories', 'reels', 'tv', 'p', 'reel', 'tags', 'locations']
-                if username.lower() not in invalid and username.lower() not in seen_usernames:
-                    seen_usernames.add(username.lower())
+                username_lower = username.lower()
+                if username_lower not in _RESERVED_INSTAGRAM_PATHS and username_lower not in seen_usernames:
+                    seen_usernames.add(username_lower)
                     url = f"https://instagram.com/{username}"
                     instagram_profiles.append({
                         "url": url,
                         "username": username,
                         "position": len(instagram_profiles) + 1
                     })
-                    logger.debug(f"Found Instagram profile via regex: @{username}")
+                    logger.debug("Found Instagram profile via regex", username=username)
                     if len(instagram_profiles) >= limit:
                         break
             
@@ -197,18 +262,16 @@ class InstagramScraper(BaseSocialScraper):
                     href = link.get('href', '')
                     
                     # Skip ads ve Google'ın kendi linkleri
-                    if any(x in href for x in ['googleadservices.com', 'doubleclick.net', 'google.com/search', 'google.com/url']):
+                    if any(x in href for x in _AD_LINK_MARKERS):
                         continue
                     
                     # Instagram linki mi?
                     if 'instagram.com' in href:
                         # Post/reel değil, profil olmalı
-                        if any(x in href for x in ['/p/', '/reel/', '/tv/', '/stories/', '/explore/', '/accounts/']):
+                        if any(x in href for x in _NON_PROFILE_PATH_MARKERS):
                             continue
                         
                         # URL'yi temizle - Google'ın redirect URL'lerini handle et
-                        import urllib.parse
-                        
                         if href.startswith('/url?q='):
                             href = urllib.parse.unquote(href.split('/url?q=')[1].split('&')[0])
                         elif href.startswith('/url?'):
@@ -239,17 +302,17 @@ class InstagramScraper(BaseSocialScraper):
                         # Geçerli username mi?
                         if username and len(username) > 0:
                             # Sistem sayfalarını skip et
-                            invalid = ['www', 'accounts', 'explore', 'direct', 'about', 'blog', 'developers', 'popular', 'help', 'legal', 'stories', 'reels', 'tv', 'p', 'reel', 'tags', 'locations']
-                            if username.lower() not in invalid:
-                                if username.lower() not in seen_usernames:
-                                    seen_usernames.add(username.lower())
+                            username_lower = username.lower()
+                            if username_lower not in _RESERVED_INSTAGRAM_PATHS:
+                                if username_lower not in seen_usernames:
+                                    seen_usernames.add(username_lower)
                                     url = f"https://instagram.com/{username}"
                                     instagram_profiles.append({
                                         "url": url,
                                         "username": username,
                                         "position": len(instagram_profiles) + 1  # İlk bulunan = en üstte
                                     })
-                                    logger.debug(f"Found Instagram profile: @{username} (position: {len(instagram_profiles)})")
+                                    logger.debug("Found Instagram profile", username=username, position=len(instagram_profiles))
                                     
                                     # İlk birkaç sonuç yeterli (Google'ın en üstteki sonuçları)
                                     if len(instagram_profiles) >= limit:
@@ -265,17 +328,15 @@ class InstagramScraper(BaseSocialScraper):
             instagram_urls = [p["url"] for p in instagram_profiles]
             
             # Bulunan profilleri logla
-            if instagram_profiles:
-                usernames = [f"@{p['username']}" for p in instagram_profiles]
-                logger.info(
-                    f"🔍 DuckDuckGo found {len(instagram_urls)} Instagram profiles: {', '.join(usernames)}"
-                )
-            else:
-                logger.info(f"DuckDuckGo found 0 Instagram profiles")
+            logger.info(
+                "DuckDuckGo found Instagram profiles",
+                count=len(instagram_urls),
+                usernames=[p["username"] for p in instagram_profiles]
+            )
             
             # Debug: Eğer hiç bulamadıysak HTML'in bir kısmını logla
             if not instagram_urls:
-                logger.debug(f"DuckDuckGo HTML length: {len(response_text)} chars")
+                logger.debug("DuckDuckGo HTML length", characters=len(response_text))
                 # Instagram kelimesi var mı kontrol et
                 if 'instagram' in response_text.lower():
                     logger.debug("'instagram' found in DuckDuckGo HTML but couldn't extract profiles")
@@ -301,8 +362,6 @@ class InstagramScraper(BaseSocialScraper):
             List of profile dictionaries with username and followers_count
         """
         import instaloader
-        import time
-        import random
         
         L = self._get_authenticated_loader()
         
@@ -313,7 +372,7 @@ class InstagramScraper(BaseSocialScraper):
         google_urls = self._search_duckduckgo_for_instagram(company_name, limit=limit)
         
         if google_urls:
-            logger.info(f"Checking {len(google_urls)} profiles found via Google (top results are usually best)")
+            logger.info("Checking profiles found via Google (top results are usually best)", count=len(google_urls))
             for i, url in enumerate(google_urls, 1):
                 try:
                     # Extract username from URL
@@ -334,20 +393,16 @@ class InstagramScraper(BaseSocialScraper):
                             "google_position": i  # Google'daki sıralama
                         })
                         logger.info(
-                            f"Found profile via Google (position {i}): @{username} ({profile.followers:,} followers)"
+                            "Found profile via Google",
+                            position=i,
+                            username=username,
+                            followers=profile.followers
                         )
                     except (instaloader.exceptions.LoginRequiredException, instaloader.exceptions.QueryReturnedBadRequestException):
                         # Session yoksa veya 401 hatası alırsa, follower bilgisi olmadan ekle
-                        logger.warning(f"Could not fetch full profile for @{username} (login required), using basic info")
+                        logger.warning("Could not fetch full profile (login required), using basic info", username=username)
                         # Mock profile objesi oluştur (minimal bilgi ile)
-                        class MockProfile:
-                            def __init__(self, uname):
-                                self.username = uname
-                                self.followers = 0  # Bilinmiyor
-                                self.mediacount = 0
-                                self.biography = ""
-
-                        mock_profile = MockProfile(username)
+                        mock_profile = _BasicProfile(username)
                         found_profiles.append({
                             "username": username,
                             "followers": 0,  # Follower sayısını bilemiyoruz
@@ -355,7 +410,7 @@ class InstagramScraper(BaseSocialScraper):
                             "source": "google",
                             "google_position": i
                         })
-                        logger.info(f"Added profile without follower count: @{username} (position {i})")
+                        logger.info("Added profile without follower count", username=username, position=i)
                     
                     # Google'ın ilk 2-3 sonucu genelde en iyisi, onları kontrol et yeter
                     # Ama limit'e kadar devam et
@@ -363,37 +418,25 @@ class InstagramScraper(BaseSocialScraper):
                         break
                         
                 except instaloader.exceptions.ProfileNotExistsException:
-                    logger.debug(f"Profile @{username} not found (from Google result)")
+                    logger.debug("Profile not found (from Google result)", username=username)
                     continue
                 except Exception as e:
-                    logger.debug(f"Error checking {username}: {e}")
+                    logger.debug("Error checking username", username=username, error=str(e))
                     continue
         
         # Strategy 2: Fallback to common username patterns (ONLY if Google found nothing)
         if len(found_profiles) == 0:
             logger.info("Trying common username patterns as fallback")
             
-            # Türkçe karakterleri temizle - Instagram username'lerde Türkçe karakter yok
-            def clean_turkish(text: str) -> str:
-                replacements = {
-                    'ı': 'i', 'İ': 'I', 'ş': 's', 'Ş': 'S',
-                    'ğ': 'g', 'Ğ': 'G', 'ü': 'u', 'Ü': 'U',
-                    'ö': 'o', 'Ö': 'O', 'ç': 'c', 'Ç': 'C'
-                }
-                for tr, en in replacements.items():
-                    text = text.replace(tr, en)
-                return text
-            
-            # Clean company name
-            name_clean = clean_turkish(company_name.lower().strip())
+            # Clean company name - Türkçe karakterleri temizle
+            name_clean = company_name.lower().strip().translate(_TURKISH_TO_ASCII)
             name_clean = name_clean.replace(" real estate", "").replace(" properties", "")
             name_clean = name_clean.replace(" group", "").replace(" company", "")
             name_clean = name_clean.replace(" inc", "").replace(" ltd", "").replace(" llc", "")
             name_clean = name_clean.replace(" yapi", "").replace(" insaat", "")  # Türkçe kelimeler
             
             # Generate simple variations
-            base = name_clean.replace(" ", "").replace("&", "").replace(".", "").replace(",", "")
-            base = base.replace("-", "").replace("_", "").replace("'", "").replace('"', "")
+            base = name_clean.translate(_USERNAME_STRIP)
             
             if base and len(base) >= 3:
                 # Ana firma adı ve varyasyonları
@@ -407,19 +450,20 @@ class InstagramScraper(BaseSocialScraper):
                     f"{base}_official",  # folkart_official
                 ]
                 
-                logger.info(f"Trying usernames: {usernames_to_try[:5]}")
+                logger.info("Trying usernames", usernames=usernames_to_try[:5])
                 
                 if " " in name_clean:
-                    parts = [p.replace(" ", "").replace("-", "") for p in name_clean.split() if p]
+                    parts = [p.replace("-", "") for p in name_clean.split() if p]
                     if len(parts) > 1:
                         usernames_to_try.extend(["_".join(parts)])
                 
+                found_usernames = {p["username"] for p in found_profiles}
                 for username in usernames_to_try[:3]:  # Limit to 3 more attempts
                     if len(found_profiles) >= limit:
                         break
                     
                     # Skip if already found
-                    if any(p["username"] == username for p in found_profiles):
+                    if username in found_usernames:
                         continue
                     
                     try:
@@ -432,11 +476,12 @@ class InstagramScraper(BaseSocialScraper):
                             "followers": profile.followers,
                             "profile": profile
                         })
-                        logger.debug(f"Found profile: @{username} ({profile.followers:,} followers)")
+                        found_usernames.add(profile.username)
+                        logger.debug("Found profile", username=username, followers=profile.followers)
                     except instaloader.exceptions.ProfileNotExistsException:
                         continue
                     except Exception as e:
-                        logger.debug(f"Error checking {username}: {e}")
+                        logger.debug("Error checking username", username=username, error=str(e))
                         continue
         
         return found_profiles
@@ -461,8 +506,7 @@ class InstagramScraper(BaseSocialScraper):
         name_clean = name_clean.replace(" llc", "").replace(" corp", "")
         
         # Basic cleaning
-        base = name_clean.replace(" ", "").replace("&", "").replace(".", "").replace(",", "")
-        base = base.replace("-", "").replace("_", "").replace("'", "").replace('"', "")
+        base = name_clean.translate(_USERNAME_STRIP)
         
         if not base:
             return variations
@@ -471,7 +515,7 @@ class InstagramScraper(BaseSocialScraper):
         variations.append(base)
         
         # Variation 2-4: With separator (if has multiple words)
-        parts = [p.replace(" ", "").replace("-", "").replace(".", "") for p in name_clean.split() if p]
+        parts = [p.translate(_USERNAME_PART_STRIP) for p in name_clean.split() if p]
         if len(parts) > 1:
             variations.append("_".join(parts))  # With underscore
             variations.append(".".join(parts))    # With dot
@@ -605,7 +649,7 @@ class InstagramScraper(BaseSocialScraper):
                             username=username
                         )
                         try:
-                            L = self._get_authenticated_loader(force_relogin=True)
+                            L = self._get_authenticated_loader(force_relogin=True, stale_loader=L)
                             profile = instaloader.Profile.from_username(L.context, username)
                         except Exception as retry_error:
                             retry_error_str = str(retry_error)
@@ -667,7 +711,8 @@ class InstagramScraper(BaseSocialScraper):
                         # Handle individual post errors
                         error_count += 1
                         logger.warning(
-                            f"Error processing post {count + 1}",
+                            "Error processing post",
+                            post_index=count + 1,
                             username=username,
                             error=str(e),
                             error_count=error_count
@@ -692,7 +737,7 @@ class InstagramScraper(BaseSocialScraper):
                 )
                 # Return whatever posts we managed to get
                 if posts:
-                    logger.info(f"Returning {len(posts)} posts despite error")
+                    logger.info("Returning posts despite error", username=username, count=len(posts))
                     return posts
                 else:
                     logger.warning(
@@ -751,7 +796,7 @@ class InstagramScraper(BaseSocialScraper):
                             username=username
                         )
                         try:
-                            L = self._get_authenticated_loader(force_relogin=True)
+                            L = self._get_authenticated_loader(force_relogin=True, stale_loader=L)
                             profile = instaloader.Profile.from_username(L.context, username)
                         except Exception as retry_error:
                             retry_error_str = str(retry_error)
@@ -802,7 +847,7 @@ class InstagramScraper(BaseSocialScraper):
     def _calculate_avg_likes(self, profile) -> int:
         """Calculate average likes from recent posts"""
         try:
-            posts = list(profile.get_posts())[:10]  # Sample last 10 posts
+            posts = list(islice(profile.get_posts(), 10))  # Sample last 10 posts
             if not posts:
                 return 0
             total_likes = sum(p.likes for p in posts)
@@ -813,7 +858,7 @@ class InstagramScraper(BaseSocialScraper):
     def _calculate_avg_comments(self, profile) -> int:
         """Calculate average comments from recent posts"""
         try:
-            posts = list(profile.get_posts())[:10]
+            posts = list(islice(profile.get_posts(), 10))
             if not posts:
                 return 0
             total_comments = sum(p.comments for p in posts)
@@ -824,7 +869,7 @@ class InstagramScraper(BaseSocialScraper):
     def _calculate_posting_frequency(self, profile) -> float:
         """Calculate posts per week"""
         try:
-            posts = list(profile.get_posts())[:20]
+            posts = list(islice(profile.get_posts(), 20))
             if len(posts) < 2:
                 return 0.0
 
@@ -841,7 +886,7 @@ class InstagramScraper(BaseSocialScraper):
     def _calculate_video_ratio(self, profile) -> float:
         """Calculate ratio of video posts"""
         try:
-            posts = list(profile.get_posts())[:20]
+            posts = list(islice(profile.get_posts(), 20))
             if not posts:
                 return 0.0
 
@@ -7,13 +7,176 @@ Supports multiple providers:
 """
 
 import json
+import orjson
+import time
+import hashlib
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Any
 import structlog
 from config.settings import settings
 
 logger = structlog.get_logger(__name__)
 
+# Shared HTTP session so LLM calls reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+# Request bodies are pre-encoded with orjson (UTF-8, no \uXXXX escaping of
+# the Turkish HTML in prompts), so the content type is set explicitly
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Rough upper bound on output tokens per extracted company JSON object
+_TOKENS_PER_COMPANY = 60
+
+
+# Cached /api/tags model names per Ollama base URL: {base_url: (fetched_at, names)}
+_TAGS_CACHE: Dict[str, tuple] = {}
+_TAGS_TTL_SECONDS = 30.0
+
+
+def _get_ollama_tags(base_url: str, ttl: float = _TAGS_TTL_SECONDS) -> List[str]:
+    """
+    Get installed Ollama model names, cached for `ttl` seconds
+
+    Args:
+        base_url: Ollama API base URL
+        ttl: Cache lifetime in seconds
+
+    Returns:
+        List of model names reported by /api/tags
+    """
+    cached = _TAGS_CACHE.get(base_url)
+    now = time.monotonic()
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+
+    response = _SESSION.get(f"{base_url}/api/tags", timeout=5)
+    response.raise_for_status()
+
+    models = orjson.loads(response.content).get("models", [])
+    model_names = [m.get("name", "") for m in models]
+    _TAGS_CACHE[base_url] = (now, model_names)
+    return model_names
+
+
+class _LFUCache:
+    """Small in-process LFU cache with per-entry TTL (thread-safe)"""
+
+    def __init__(self, capacity: int = 1024, ttl_seconds: float = 24 * 3600):
+        self.capacity = capacity
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, tuple] = {}  # key -> (stored_at, value)
+        self._hits: Dict[str, int] = {}
+        # Shared by concurrent discovery pipelines through the shared parser
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                del self._hits[key]
+                return None
+            self._hits[key] += 1
+            return entry[1]
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if key not in self._entries and len(self._entries) >= self.capacity:
+                # Expired entries go first, so they never push out fresh ones
+                self._purge_expired(now)
+            if key not in self._entries and len(self._entries) >= self.capacity:
+                # Evict the least frequently used entry
+                victim = min(self._hits, key=self._hits.get)
+                del self._entries[victim]
+                del self._hits[victim]
+            self._entries[key] = (now, value)
+            self._hits.setdefault(key, 0)
+
+    def _purge_expired(self, now: float) -> None:
+        """Drop entries older than the TTL; caller holds _lock"""
+        expired = [
+            key for key, (stored_at, _) in self._entries.items()
+            if now - stored_at > self.ttl_seconds
+        ]
+        for key in expired:
+            del self._entries[key]
+            del self._hits[key]
+
+
+# LLM extraction results keyed by content hash, so re-crawled (or
+# cache-served) pages are not sent through the model again
+_EXTRACTION_CACHE = _LFUCache()
+
+
+class _JSONEndDetector:
+    """
+    Incrementally detect when a leading top-level JSON value is closed
+
+    Tracking starts only when the output opens with `{`/`[` (after
+    whitespace) or right after a ``` fence line. Output that starts with
+    prose is never cut short, since brackets in prose ("Here [is] ...")
+    are not the JSON value.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.disabled = False
+        self.in_string = False
+        self.escaped = False
+        self._lead = ""  # Text seen before the JSON value starts
+        self.end = None  # Offset just past the closing bracket in the last chunk
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Consume a streamed chunk
+
+        Returns:
+            True once the leading top-level object/array has been closed
+            (`end` then holds the offset just past it within `chunk`)
+        """
+        for index, char in enumerate(chunk):
+            if self.disabled:
+                return False
+            if not self.started:
+                self._lead += char
+                lead = self._lead.lstrip()
+                if not lead:
+                    continue
+                if lead[0] in "{[":
+                    self.started = True
+                    self.depth = 1
+                elif lead.startswith("```"):
+                    # Skip the fence line (```json); the value starts after it
+                    if "\n" in lead:
+                        self._lead = ""
+                elif not "```".startswith(lead):
+                    self.disabled = True
+            elif self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char in "{[":
+                self.depth += 1
+            elif char in "}]":
+                self.depth -= 1
+                if self.depth == 0:
+                    self.end = index + 1
+                    return True
+        return False
+
 
 class OllamaLLMService:
     """Service for interacting with Ollama API"""
@@ -22,7 +185,8 @@ class OllamaLLMService:
         self,
         base_url: str = None,
         model: str = None,
-        timeout: int = 120
+        timeout: int = 120,
+        num_ctx: int = None
     ):
         """
         Initialize Ollama LLM service
@@ -31,10 +195,14 @@ class OllamaLLMService:
             base_url: Ollama API base URL (default from settings)
             model: Model name (default from settings)
             timeout: Request timeout in seconds
+            num_ctx: Context window in tokens (default from settings); sent
+                unchanged on every request, since Ollama reloads the model
+                whenever num_ctx differs from the loaded runner's
         """
         self.base_url = base_url or settings.OLLAMA_BASE_URL
         self.model = model or settings.OLLAMA_MODEL
         self.timeout = timeout
+        self.num_ctx = num_ctx or settings.OLLAMA_NUM_CTX
         
         logger.info(
             "Initialized OllamaLLMService",
@@ -47,16 +215,22 @@ class OllamaLLMService:
         prompt: str,
         system_prompt: Optional[str] = None,
         temperature: float = 0.1,
-        max_tokens: int = 4000
+        max_tokens: int = 4000,
+        stop_at_json_end: bool = False
     ) -> str:
         """
         Generate completion from Ollama
+
+        The response is streamed, so parsing can start as soon as
+        generation finishes and JSON-only calls can stop early.
         
         Args:
             prompt: User prompt
             system_prompt: System prompt for context
             temperature: Sampling temperature (0.0 = deterministic)
             max_tokens: Maximum tokens to generate
+            stop_at_json_end: Close the stream once the first top-level
+                JSON value is complete (skips trailing decode tokens)
             
         Returns:
             Generated text
@@ -67,10 +241,11 @@ class OllamaLLMService:
             payload = {
                 "model": self.model,
                 "prompt": prompt,
-                "stream": False,
+                "stream": True,
                 "options": {
                     "temperature": temperature,
-                    "num_predict": max_tokens
+                    "num_predict": max_tokens,
+                    "num_ctx": self.num_ctx
                 }
             }
             
@@ -83,16 +258,33 @@ class OllamaLLMService:
                 prompt_length=len(prompt)
             )
             
-            response = requests.post(
+            chunks = []
+            detector = _JSONEndDetector() if stop_at_json_end else None
+
+            with _SESSION.post(
                 url,
-                json=payload,
-                timeout=self.timeout
-            )
-            
-            response.raise_for_status()
-            result = response.json()
-            
-            generated_text = result.get("response", "")
+                data=orjson.dumps(payload),
+                headers=_JSON_HEADERS,
+                timeout=self.timeout,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    result = orjson.loads(line)
+                    token = result.get("response", "")
+                    if detector and detector.feed(token):
+                        # Drop anything after the closing bracket
+                        chunks.append(token[:detector.end])
+                        logger.debug("JSON complete, closing Ollama stream early")
+                        break
+                    chunks.append(token)
+                    if result.get("done"):
+                        break
+
+            generated_text = "".join(chunks)
             
             logger.debug(
                 "Received response from Ollama",
@@ -112,9 +304,39 @@ class OllamaLLMService:
             )
             raise Exception(f"Cannot connect to Ollama at {self.base_url}")
         except Exception as e:
-            logger.error(f"Ollama generation error: {e}", exc_info=True)
+            logger.error("Ollama generation error", error=str(e), exc_info=True)
             raise
     
+    def warmup(self) -> bool:
+        """
+        Load the model into Ollama memory with a 1-token generation
+
+        Ollama loads a model on its first /api/generate call, so without
+        this the first real extraction pays the full model-load latency.
+
+        Returns:
+            True if the model responded, False otherwise
+        """
+        try:
+            # Same num_ctx as generate(), or the first real request reloads
+            response = _SESSION.post(
+                f"{self.base_url}/api/generate",
+                data=orjson.dumps({
+                    "model": self.model,
+                    "prompt": ".",
+                    "stream": False,
+                    "options": {"num_predict": 1, "num_ctx": self.num_ctx}
+                }),
+                headers=_JSON_HEADERS,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            logger.info("Ollama model warmed up", model=self.model)
+            return True
+        except Exception as e:
+            logger.warning("Ollama warmup failed", model=self.model, error=str(e))
+            return False
+
     def extract_json_from_text(self, text: str) -> Optional[Dict]:
         """
         Extract JSON from LLM response
@@ -125,6 +347,11 @@ class OllamaLLMService:
         Returns:
             Parsed JSON dict or None if parsing failed
         """
+        # Short-circuit responses that cannot contain a JSON object/array
+        if "{" not in text and "[" not in text:
+            logger.warning("LLM response contains no JSON", text_preview=text[:200])
+            return None
+
         try:
             # Remove markdown code blocks if present
             if "```json" in text:
@@ -135,15 +362,15 @@ class OllamaLLMService:
             # Clean up whitespace
             text = text.strip()
             
-            # Parse JSON
-            data = json.loads(text)
+            # Parse JSON (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+            data = orjson.loads(text)
             return data
             
         except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse JSON: {e}", text_preview=text[:200])
+            logger.warning("Failed to parse JSON", error=str(e), text_preview=text[:200])
             return None
         except Exception as e:
-            logger.error(f"JSON extraction error: {e}", exc_info=True)
+            logger.error("JSON extraction error", error=str(e), exc_info=True)
             return None
 
 
@@ -231,15 +458,15 @@ class GroqLLMService:
                 prompt_length=len(prompt)
             )
 
-            response = requests.post(
+            response = _SESSION.post(
                 url,
-                json=payload,
+                data=orjson.dumps(payload),
                 headers=headers,
                 timeout=self.timeout
             )
 
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
 
             generated_text = result["choices"][0]["message"]["content"]
 
@@ -261,10 +488,10 @@ class GroqLLMService:
                 logger.error("Groq rate limit exceeded")
                 raise Exception("Groq rate limit exceeded - try again later")
             else:
-                logger.error(f"Groq API error: {e}")
+                logger.error("Groq API error", error=str(e))
                 raise
         except Exception as e:
-            logger.error(f"Groq generation error: {e}", exc_info=True)
+            logger.error("Groq generation error", error=str(e), exc_info=True)
             raise
 
     def extract_json_from_text(self, text: str) -> Optional[Dict]:
@@ -277,6 +504,11 @@ class GroqLLMService:
         Returns:
             Parsed JSON dict or None if parsing failed
         """
+        # Short-circuit responses that cannot contain a JSON object/array
+        if "{" not in text and "[" not in text:
+            logger.warning("LLM response contains no JSON", text_preview=text[:200])
+            return None
+
         try:
             # Remove markdown code blocks if present
             if "```json" in text:
@@ -287,18 +519,48 @@ class GroqLLMService:
             # Clean up whitespace
             text = text.strip()
 
-            # Parse JSON
-            data = json.loads(text)
+            # Parse JSON (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+            data = orjson.loads(text)
             return data
 
         except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse JSON: {e}", text_preview=text[:200])
+            logger.warning("Failed to parse JSON", error=str(e), text_preview=text[:200])
             return None
         except Exception as e:
-            logger.error(f"JSON extraction error: {e}", exc_info=True)
+            logger.error("JSON extraction error", error=str(e), exc_info=True)
             return None
 
 
+# Output schema, minified once at import to keep prompt tokens down
+_COMPANY_OUTPUT_SCHEMA = json.dumps(
+    {"companies": [{"name": "", "website_url": "", "source": ""}]},
+    separators=(",", ":")
+)
+
+_COMPANY_EXTRACTION_SYSTEM_PROMPT = f"""You extract real estate company data from web page text.
+
+RULES:
+1. Return ONLY valid JSON, no other text
+2. Extract company/agency names, not individual agents (use their brokerage)
+3. Include website URLs when available
+4. Skip duplicates
+5. Return an empty list if no companies are found
+
+Output format: {_COMPANY_OUTPUT_SCHEMA}"""
+
+# Static skeleton of the per-page user prompt, filled with str.format
+_COMPANY_EXTRACTION_USER_PROMPT = """Extract up to {limit} real estate companies from this web page.
+
+Search context: {query_context}
+
+Web page content:
+---
+{text_content}
+---
+
+Extract companies in JSON format. Return only the JSON, no other text."""
+
+
 class HTMLCompanyExtractor:
     """Extract structured company data from HTML using LLM"""
 
@@ -337,6 +599,16 @@ class HTMLCompanyExtractor:
         Returns:
             List of company dictionaries with name, website_url, etc.
         """
+        cache_key = hashlib.blake2b(
+            f"{self.llm.model}|{query_context}|{limit}|".encode("utf-8")
+            + html_content.encode("utf-8"),
+            digest_size=16
+        ).hexdigest()
+        cached = _EXTRACTION_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info("LLM extraction cache hit", query_context=query_context)
+            return list(cached)
+
         try:
             # Clean HTML (remove scripts, styles, keep text)
             from bs4 import BeautifulSoup
@@ -365,11 +637,18 @@ class HTMLCompanyExtractor:
             system_prompt = self._build_system_prompt()
             user_prompt = self._build_user_prompt(text_content, query_context, limit)
             
-            # Generate
+            # Generate (Ollama can stop streaming once the JSON closes)
+            extra_options = (
+                {"stop_at_json_end": True}
+                if isinstance(self.llm, OllamaLLMService) else {}
+            )
             response = self.llm.generate(
                 prompt=user_prompt,
                 system_prompt=system_prompt,
-                temperature=0.1  # Low temperature for structured output
+                temperature=0.1,  # Low temperature for structured output
+                # Output budget scales with how many companies we asked for
+                max_tokens=min(4000, 64 + _TOKENS_PER_COMPANY * limit),
+                **extra_options
             )
             
             # Extract JSON
@@ -387,44 +666,26 @@ class HTMLCompanyExtractor:
                 # LLM returned {"companies": [...]}
                 companies = data.get("companies", [])
             else:
-                logger.warning(f"LLM response unexpected type: {type(data)}")
+                logger.warning("LLM response unexpected type", type=type(data).__name__)
                 return []
             
             if not isinstance(companies, list):
                 logger.warning("LLM response 'companies' is not a list")
                 return []
             
-            logger.info(f"LLM extracted {len(companies)} companies")
-            return companies[:limit]
+            logger.info("LLM extracted companies", count=len(companies))
+            companies = companies[:limit]
+            if companies:
+                _EXTRACTION_CACHE.put(cache_key, list(companies))
+            return companies
             
         except Exception as e:
-            logger.error(f"Company extraction error: {e}", exc_info=True)
+            logger.error("Company extraction error", error=str(e), exc_info=True)
             return []
     
     def _build_system_prompt(self) -> str:
         """Build system prompt for company extraction"""
-        return """You are a data extraction assistant specialized in parsing real estate business information from web pages.
-
-Your task is to extract structured company data from HTML content.
-
-IMPORTANT RULES:
-1. Return ONLY valid JSON, no additional text
-2. Extract company/agency names, not individual agent names
-3. If you find agent names, use their brokerage/company instead
-4. Include website URLs when available
-5. Skip duplicates
-6. Return empty array if no companies found
-
-Output format:
-{
-  "companies": [
-    {
-      "name": "Company Name",
-      "website_url": "https://example.com",
-      "source": "website_name"
-    }
-  ]
-}"""
+        return _COMPANY_EXTRACTION_SYSTEM_PROMPT
     
     def _build_user_prompt(
         self,
@@ -433,43 +694,40 @@ Output format:
         limit: int
     ) -> str:
         """Build user prompt with content"""
-        return f"""Extract up to {limit} real estate companies from this web page.
-
-Search context: {query_context}
-
-Web page content:
----
-{text_content}
----
-
-Extract companies in JSON format. Return only the JSON, no other text."""
+        return _COMPANY_EXTRACTION_USER_PROMPT.format(
+            limit=limit,
+            query_context=query_context,
+            text_content=text_content
+        )
     
     def check_ollama_available(self) -> bool:
         """
         Check if Ollama is running and model is available
+
+        Hosted providers (Groq) have no /api/tags endpoint, so the check
+        is skipped for them instead of making a request that always fails.
         
         Returns:
-            True if Ollama is accessible, False otherwise
+            True if Ollama is accessible (or not in use), False otherwise
         """
+        if not isinstance(self.llm, OllamaLLMService):
+            return True
+
         try:
-            url = f"{self.llm.base_url}/api/tags"
-            response = requests.get(url, timeout=5)
-            response.raise_for_status()
-            
-            data = response.json()
-            models = data.get("models", [])
-            model_names = [m.get("name", "") for m in models]
+            model_names = _get_ollama_tags(self.llm.base_url)
             
-            model_available = any(
+            # Exact tag match first, then a single substring pass
+            model_available = self.llm.model in model_names or any(
                 self.llm.model in name
                 for name in model_names
             )
             
             if model_available:
-                logger.info(f"Ollama model {self.llm.model} is available")
+                logger.info("Ollama model is available", model=self.llm.model)
             else:
                 logger.warning(
-                    f"Model {self.llm.model} not found",
+                    "Ollama model not found",
+                    model=self.llm.model,
                     available_models=model_names,
                     hint=f"Run: ollama pull {self.llm.model}"
                 )
@@ -478,7 +736,8 @@ Extract companies in JSON format. Return only the JSON, no other text."""
             
         except Exception as e:
             logger.warning(
-                f"Ollama not available: {e}",
+                "Ollama not available",
+                error=str(e),
                 hint="Make sure Ollama is running: 'ollama serve'"
             )
             return False
@@ -1,6 +1,9 @@
+import os
+import stat
 import subprocess
 import json
 import pickle
+import threading
 from pathlib import Path
 from typing import Dict, Optional
 from config.settings import settings
@@ -10,6 +13,31 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Static parts of the Netscape cookies file, encoded once at import
+_COOKIES_FILE_HEADER = (
+    b"# Netscape HTTP Cookie File\n"
+    b"# This file was generated by VideoDownloadService\n\n"
+)
+# Netscape format: domain, flag, path, secure, expiration (0 = session cookie), name, value
+_INSTAGRAM_COOKIE_PREFIX = b".instagram.com\tTRUE\t/\tTRUE\t0\t"
+
+# Video file extensions yt-dlp may produce, in preference order
+_VIDEO_EXTENSIONS = (".mp4", ".mkv", ".webm", ".mov", ".avi", ".flv")
+# Same extensions for O(1) membership tests while scanning a directory
+_VIDEO_EXTENSION_SET = frozenset(_VIDEO_EXTENSIONS)
+
+
+def _ffmpeg_threads() -> int:
+    """
+    Threads for each ffmpeg merge yt-dlp runs
+
+    ffmpeg defaults to one thread per core; with several downloads merging
+    at once that oversubscribes the CPU, so split the cores between them.
+    """
+    if settings.YTDLP_FFMPEG_THREADS:
+        return settings.YTDLP_FFMPEG_THREADS
+    return max(1, (os.cpu_count() or 1) // max(1, settings.VIDEO_DOWNLOAD_CONCURRENCY))
+
 
 class VideoDownloadService:
     """Service for downloading videos using yt-dlp"""
@@ -24,22 +52,64 @@ class VideoDownloadService:
         self.base_path = download_base_path or settings.DOWNLOAD_BASE_PATH
         self.base_path = Path(self.base_path)
         self.cookies_file = None
+        # Session file mtime the cached cookies_file was generated from
+        self._cookies_source_mtime: Optional[float] = None
+        # Platform output directories already created by this service
+        self._output_dirs: Dict[str, Path] = {}
+        self.ffmpeg_threads = _ffmpeg_threads()
+        # Downloads may run on several threads; serialize cookies file writes
+        self._cookies_lock = threading.Lock()
+
+    def _get_output_dir(self, platform: str) -> Path:
+        """
+        Get the platform download directory, creating it on first use
+
+        Args:
+            platform: Platform name (instagram, tiktok, youtube)
+
+        Returns:
+            Path to the platform directory
+        """
+        output_dir = self._output_dirs.get(platform)
+        if output_dir is None:
+            output_dir = self.base_path / platform
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._output_dirs[platform] = output_dir
+        return output_dir
 
     def _prepare_instagram_cookies(self) -> Optional[Path]:
         """
         Prepare Instagram cookies file from instaloader session
 
+        The file is regenerated only when the session file changes; other
+        downloads reuse the cached path.
+
         Returns:
             Path to cookies file if successful, None otherwise
         """
+        with self._cookies_lock:
+            return self._prepare_instagram_cookies_locked()
+
+    def _prepare_instagram_cookies_locked(self) -> Optional[Path]:
+        """Body of _prepare_instagram_cookies; caller holds _cookies_lock"""
         try:
             # Path to instaloader session file
-            session_file = Path(__file__).parent.parent / "data" / ".instaloader_session"
+            session_file = settings.INSTAGRAM_SESSION_FILE
 
-            if not session_file.exists():
+            # One stat() both checks existence and gives the mtime
+            try:
+                session_mtime = session_file.stat().st_mtime
+            except FileNotFoundError:
                 logger.warning("Instaloader session file not found", path=str(session_file))
                 return None
 
+            if (
+                self.cookies_file is not None
+                and session_mtime == self._cookies_source_mtime
+                and self.cookies_file.exists()
+            ):
+                return self.cookies_file
+
             # Load instaloader session (dict of cookie_name: cookie_value)
             with open(session_file, 'rb') as f:
                 session_data = pickle.load(f)
@@ -51,22 +121,17 @@ class VideoDownloadService:
             # Create cookies file for yt-dlp (Netscape format)
             cookies_file = self.base_path / "instagram_cookies.txt"
 
-            with open(cookies_file, 'w') as f:
-                # Netscape HTTP Cookie File header
-                f.write("# Netscape HTTP Cookie File\n")
-                f.write("# This file was generated by VideoDownloadService\n\n")
+            # Convert session dict to Netscape cookie format
+            # Instaloader stores cookies as {name: value}; only name/value need encoding
+            parts = [_COOKIES_FILE_HEADER]
+            for name, value in session_data.items():
+                parts.append(_INSTAGRAM_COOKIE_PREFIX)
+                parts.append(f"{name}\t{value}\n".encode("utf-8"))
 
-                # Convert session dict to Netscape cookie format
-                # Instaloader stores cookies as {name: value}
-                for name, value in session_data.items():
-                    # Netscape format: domain, flag, path, secure, expiration, name, value
-                    domain = ".instagram.com"
-                    flag = "TRUE"
-                    path = "/"
-                    secure = "TRUE"
-                    expiration = "0"  # Session cookie
+            cookies_file.write_bytes(b"".join(parts))
 
-                    f.write(f"{domain}\t{flag}\t{path}\t{secure}\t{expiration}\t{name}\t{value}\n")
+            self.cookies_file = cookies_file
+            self._cookies_source_mtime = session_mtime
 
             logger.info("Instagram cookies file prepared", path=str(cookies_file), cookie_count=len(session_data))
             return cookies_file
@@ -94,8 +159,7 @@ class VideoDownloadService:
             - error: Error message (if failed)
         """
         # Create platform-specific directory
-        output_dir = self.base_path / platform
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = self._get_output_dir(platform)
 
         # Sanitize post_id for filename
         safe_post_id = sanitize_filename(post_id)
@@ -108,6 +172,8 @@ class VideoDownloadService:
             "--no-playlist",
             "--write-info-json",
             "--max-filesize", settings.YTDLP_MAX_FILESIZE,
+            # Explicit thread count for the ffmpeg merge of video+audio streams
+            "--postprocessor-args", f"ffmpeg:-threads {self.ffmpeg_threads}",
         ]
 
         # Platform-specific format selection
@@ -221,18 +287,26 @@ class VideoDownloadService:
         Returns:
             Path to video file if found, None otherwise
         """
-        # Common video extensions
-        video_extensions = [".mp4", ".mkv", ".webm", ".mov", ".avi", ".flv"]
-
-        for ext in video_extensions:
+        # Usual case: "<post_id>.<ext>" exists, found with one stat per
+        # candidate in extension preference order
+        for ext in _VIDEO_EXTENSIONS:
             video_path = output_dir / f"{post_id}{ext}"
-            if video_path.exists():
+            if video_path.is_file():
                 return video_path
 
-        # If not found with exact post_id, search for files starting with post_id
-        for file_path in output_dir.glob(f"{post_id}*"):
-            if file_path.suffix in video_extensions:
-                return file_path
+        # Miss: scan for any video file whose name starts with post_id
+        # (only on this path, since the directory grows with every download)
+        try:
+            with os.scandir(output_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.startswith(post_id):
+                        continue
+                    ext = os.path.splitext(name)[1].lower()
+                    if ext in _VIDEO_EXTENSION_SET and entry.is_file():
+                        return Path(entry.path)
+        except FileNotFoundError:
+            return None
 
         return None
 
@@ -298,7 +372,8 @@ class VideoDownloadService:
             True if file exists and is readable, False otherwise
         """
         try:
-            path = Path(file_path)
-            return path.exists() and path.is_file() and path.stat().st_size > 0
-        except Exception:
+            # Single stat() instead of exists() + is_file() + stat()
+            file_stat = os.stat(file_path)
+        except (OSError, ValueError):
             return False
+        return stat.S_ISREG(file_stat.st_mode) and file_stat.st_size > 0
@@ -0,0 +1,82 @@
+"""Tests for the video download retry classifier"""
+
+import pytest
+
+from agents.video_downloader import _is_permanent_download_error
+
+
+# Real yt-dlp stderr, as returned by VideoDownloadService on failure
+PERMANENT_ERRORS = [
+    "ERROR: [youtube] dQw4w9WgXcQ: Video unavailable\n",
+    (
+        "ERROR: [youtube] dQw4w9WgXcQ: Video unavailable. "
+        "This video has been removed by the uploader\n"
+    ),
+    (
+        "ERROR: [generic] Unable to download webpage: HTTP Error 404: Not Found "
+        "(caused by <HTTPError 404: 'Not Found'>)\n"
+    ),
+    (
+        "ERROR: [TikTok] 7301234567890123456: Unable to download webpage: "
+        "HTTP Error 410: Gone (caused by <HTTPError 410: 'Gone'>)\n"
+    ),
+    "ERROR: Unsupported URL: https://example.com/about\n",
+    (
+        "WARNING: [generic] Falling back on generic information extractor\n"
+        "ERROR: Unsupported URL: https://example.com/listings\n"
+    ),
+]
+
+TRANSIENT_ERRORS = [
+    # Instagram rate limiting mentions "login required" but clears on retry
+    (
+        "ERROR: [Instagram] C1a2B3c4D5e: Requested content is not available, "
+        "rate-limit reached or login required. Use --cookies, "
+        "--cookies-from-browser, --username and --password, --netrc-cmd, or "
+        "--netrc (instagram) to provide account credentials\n"
+    ),
+    (
+        "ERROR: [Instagram] C1a2B3c4D5e: Unable to download webpage: "
+        "HTTP Error 429: Too Many Requests "
+        "(caused by <HTTPError 429: 'Too Many Requests'>)\n"
+    ),
+    (
+        "ERROR: [Instagram] C1a2B3c4D5e: Unable to download JSON metadata: "
+        "HTTP Error 503: Service Unavailable "
+        "(caused by <HTTPError 503: 'Service Unavailable'>)\n"
+    ),
+    (
+        "ERROR: [youtube] dQw4w9WgXcQ: Unable to download API page: "
+        "HTTP Error 502: Bad Gateway (caused by <HTTPError 502: 'Bad Gateway'>)\n"
+    ),
+    (
+        "ERROR: unable to download video data: "
+        "<urlopen error [Errno 104] Connection reset by peer>\n"
+    ),
+    # Warnings mention "unavailable" without the download having failed for it
+    (
+        "WARNING: [youtube] dQw4w9WgXcQ: Some formats are unavailable\n"
+        "ERROR: [youtube] dQw4w9WgXcQ: Unable to download webpage: "
+        "<urlopen error timed out>\n"
+    ),
+    "Download timeout (5 minutes)",
+    "Unknown download error",
+]
+
+
+@pytest.mark.parametrize("error_msg", PERMANENT_ERRORS)
+def test_permanent_ytdlp_errors_are_not_retried(error_msg):
+    assert _is_permanent_download_error(error_msg) is True
+
+
+@pytest.mark.parametrize("error_msg", TRANSIENT_ERRORS)
+def test_transient_errors_are_retried(error_msg):
+    assert _is_permanent_download_error(error_msg) is False
+
+
+@pytest.mark.parametrize("error_msg", [
+    "Download completed but file not found",
+    "yt-dlp not found. Please install: pip install yt-dlp",
+])
+def test_permanent_service_errors_are_not_retried(error_msg):
+    assert _is_permanent_download_error(error_msg) is True
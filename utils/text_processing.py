@@ -1,5 +1,21 @@
 import re
 from typing import List
+from urllib.parse import urlparse
+
+# Precompiled patterns for the normalization helpers
+# Both suffix groups in one alternation, so names are scanned once
+_COMPANY_SUFFIX_PATTERN = re.compile(
+    r'\b(llc|inc|ltd|corporation|corp|company|co|group|gmbh|limited'
+    r'|plc|lp|llp|sa|ag|nv|bv)\b\.?'
+)
+_NON_ALNUM_PATTERN = re.compile(r'[^a-z0-9\s]')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+    'from', 'as', 'is', 'was', 'are', 'were', 'been', 'be', 'have', 'has', 'had', 'do', 'does',
+    'did', 'will', 'would', 'could', 'should'
+})
 
 
 def normalize_company_name(name: str) -> str:
@@ -22,18 +38,13 @@ def normalize_company_name(name: str) -> str:
     normalized = name.lower()
 
     # Remove common company suffixes
-    suffixes = [
-        r'\b(llc|inc|ltd|corporation|corp|company|co|group|gmbh|limited)\b\.?',
-        r'\b(plc|lp|llp|sa|ag|nv|bv)\b\.?'
-    ]
-    for suffix in suffixes:
-        normalized = re.sub(suffix, '', normalized)
+    normalized = _COMPANY_SUFFIX_PATTERN.sub('', normalized)
 
     # Remove special characters except spaces
-    normalized = re.sub(r'[^a-z0-9\s]', ' ', normalized)
+    normalized = _NON_ALNUM_PATTERN.sub(' ', normalized)
 
     # Remove extra whitespace
-    normalized = re.sub(r'\s+', ' ', normalized).strip()
+    normalized = _WHITESPACE_PATTERN.sub(' ', normalized).strip()
 
     return normalized
 
@@ -52,8 +63,6 @@ def extract_domain_from_url(url: str) -> str:
         "https://www.example.com/path" -> "example.com"
         "http://subdomain.example.co.uk" -> "subdomain.example.co.uk"
     """
-    from urllib.parse import urlparse
-
     parsed = urlparse(url)
     domain = parsed.netloc or parsed.path
 
@@ -75,7 +84,7 @@ def clean_text(text: str) -> str:
         Cleaned text
     """
     # Remove extra whitespace
-    cleaned = re.sub(r'\s+', ' ', text)
+    cleaned = _WHITESPACE_PATTERN.sub(' ', text)
 
     # Remove leading/trailing whitespace
     cleaned = cleaned.strip()
@@ -115,21 +124,13 @@ def extract_keywords(text: str) -> List[str]:
     text = text.lower()
 
     # Remove special characters
-    text = re.sub(r'[^a-z0-9\s]', ' ', text)
+    text = _NON_ALNUM_PATTERN.sub(' ', text)
 
     # Split into words
     words = text.split()
 
-    # Filter short words and common stopwords
-    stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been', 'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should'}
-    keywords = [word for word in words if len(word) > 3 and word not in stopwords]
-
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_keywords = []
-    for keyword in keywords:
-        if keyword not in seen:
-            seen.add(keyword)
-            unique_keywords.append(keyword)
-
-    return unique_keywords
+    # Filter short words and common stopwords, then remove duplicates
+    # while preserving order (dict keys keep insertion order)
+    return list(dict.fromkeys(
+        word for word in words if len(word) > 3 and word not in _STOPWORDS
+    ))
@@ -1,7 +1,11 @@
+import re
 import validators
 from typing import Optional
 from database.models import PlatformEnum
 
+# Characters that are invalid in Windows/Unix filenames
+_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+
 
 def validate_url(url: str) -> bool:
     """
@@ -43,9 +47,8 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename safe for filesystem
     """
-    import re
     # Remove invalid characters for Windows/Unix filenames
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    sanitized = _INVALID_FILENAME_CHARS.sub('_', filename)
     # Remove leading/trailing whitespace and dots
     sanitized = sanitized.strip('. ')
     return sanitized or "unnamed"